@@ -11,8 +11,80 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 
-from src.simulation import MonteCarloSimulator
-from src.parameters import POLICY_PARAMETERS, REVENUE_PARAMETERS
+from src.simulation import (
+    NUMBA_AVAILABLE,
+    MonteCarloSimulator,
+    sorted_percentiles
+)
+from src.parameters import POLICY_PARAMETERS, REVENUE_PARAMETERS, sample_costs
+
+# Column order of the sampled policy cost matrix
+POLICY_COLUMNS = (
+    "free_buses",
+    "universal_childcare",
+    "affordable_housing",
+    "government_grocery_stores"
+)
+
+# Number of quantiles used to draw the cumulative distribution
+CDF_POINTS = 500
+
+# Markdown bodies of the policy overview cards; the amount is filled in per scenario
+POLICY_CARD_TEXT = {
+    "free_buses": """
+            **Proposal**: Eliminate fares on all NYC buses
+
+            **Reality**:
+            - MTA currently charges $2.90 per ride
+            - ~2 million daily bus riders
+            - Bus revenue: ~$500M annually
+
+            **Your Scenario**: ${:.2f}B annual cost
+            """,
+    "universal_childcare": """
+            **Proposal**: Free childcare for all families with wage increases for workers
+
+            **Reality**:
+            - ~500,000 children under 5 in NYC
+            - Current childcare cost: $15,000-30,000/year per child
+            - Many workers earn below living wage
+
+            **Your Scenario**: ${:.2f}B annual cost
+            """,
+    "affordable_housing": """
+            **Proposal**: $100B investment over 10 years to build 200,000 affordable units using union labor
+
+            **Reality**:
+            - NYC has ~3.5M housing units total
+            - Median rent: $3,500/month in Manhattan
+            - ~500,000 rent-stabilized units
+            - Union construction costs ~30% higher than non-union
+
+            **Your Scenario**: ${:.2f}B annual cost
+            """,
+    "government_grocery_stores": """
+            **Proposal**: Create 5 government-run grocery stores (one per borough) with subsidized prices
+
+            **Reality**:
+            - Addresses food deserts in low-income neighborhoods
+            - Precedent: Some cities have food co-ops
+            - Operating costs + subsidies needed
+
+            **Your Scenario**: ${:.2f}B annual cost
+            """,
+    "tax_increases": """
+            **Proposal**:
+            - 2% tax on NYC residents earning >$1M/year
+            - Increase corporate tax rate to 11.5%
+
+            **Reality**:
+            - ~40,000 NYC households earn >$1M
+            - Concerns about wealthy residents leaving
+            - Requires state approval for income tax changes
+
+            **Your Scenario**: ${:.2f}B annual revenue
+            """
+}
 
 # Page configuration
 st.set_page_config(
@@ -230,31 +302,36 @@ def main():
         )
 
     # Tab 2 & 3: Run simulation and display results
-    if run_simulation or 'simulation_run' not in st.session_state:
-        with st.spinner("Running Monte Carlo simulation... This may take a moment."):
-            results = run_custom_simulation(
-                num_simulations,
-                threshold,
-                free_buses_mean, free_buses_std,
-                childcare_mean, childcare_std,
-                housing_mean, housing_std,
-                grocery_mean, grocery_std,
-                revenue_mean, revenue_std
-            )
-            st.session_state['simulation_run'] = True
-            st.session_state['results'] = results
+    # Only the parameter tuple lives in session state; results come from the cache
+    simulation_params = (
+        num_simulations,
+        threshold,
+        free_buses_mean, free_buses_std,
+        childcare_mean, childcare_std,
+        housing_mean, housing_std,
+        grocery_mean, grocery_std,
+        revenue_mean, revenue_std
+    )
+    if run_simulation or 'simulation_params' not in st.session_state:
+        st.session_state['simulation_params'] = simulation_params
+
+    with st.spinner("Running Monte Carlo simulation... This may take a moment."):
+        results = run_custom_simulation(*st.session_state['simulation_params'])
 
-    if 'results' in st.session_state:
-        results = st.session_state['results']
+    with tab2:
+        display_results(results, threshold)
 
-        with tab2:
-            display_results(results, threshold)
+    with tab3:
+        display_visualizations(results, threshold)
 
-        with tab3:
-            display_visualizations(results, threshold)
+    with tab4:
+        display_insights(results)
 
-        with tab4:
-            display_insights(results)
+
+@st.cache_data(show_spinner=False)
+def render_policy_card(card, amount):
+    """Fill in a policy card; callers round amount to cents so nearby inputs share a cache entry"""
+    return POLICY_CARD_TEXT[card].format(amount)
 
 
 def display_policy_overview(free_buses, childcare, housing, grocery, revenue):
@@ -288,16 +365,7 @@ def display_policy_overview(free_buses, childcare, housing, grocery, revenue):
         st.markdown("#### 🚌 Free Public Transportation")
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.markdown("""
-            **Proposal**: Eliminate fares on all NYC buses
-
-            **Reality**:
-            - MTA currently charges $2.90 per ride
-            - ~2 million daily bus riders
-            - Bus revenue: ~$500M annually
-
-            **Your Scenario**: ${:.2f}B annual cost
-            """.format(free_buses))
+            st.markdown(render_policy_card("free_buses", round(free_buses, 2)))
         with col2:
             st.metric("Cost", f"${free_buses:.2f}B")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -308,16 +376,7 @@ def display_policy_overview(free_buses, childcare, housing, grocery, revenue):
         st.markdown("#### 👶 Universal Free Childcare")
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.markdown("""
-            **Proposal**: Free childcare for all families with wage increases for workers
-
-            **Reality**:
-            - ~500,000 children under 5 in NYC
-            - Current childcare cost: $15,000-30,000/year per child
-            - Many workers earn below living wage
-
-            **Your Scenario**: ${:.2f}B annual cost
-            """.format(childcare))
+            st.markdown(render_policy_card("universal_childcare", round(childcare, 2)))
         with col2:
             st.metric("Cost", f"${childcare:.2f}B")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -328,17 +387,7 @@ def display_policy_overview(free_buses, childcare, housing, grocery, revenue):
         st.markdown("#### 🏘️ Affordable Housing Program")
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.markdown("""
-            **Proposal**: $100B investment over 10 years to build 200,000 affordable units using union labor
-
-            **Reality**:
-            - NYC has ~3.5M housing units total
-            - Median rent: $3,500/month in Manhattan
-            - ~500,000 rent-stabilized units
-            - Union construction costs ~30% higher than non-union
-
-            **Your Scenario**: ${:.2f}B annual cost
-            """.format(housing))
+            st.markdown(render_policy_card("affordable_housing", round(housing, 2)))
         with col2:
             st.metric("Cost", f"${housing:.2f}B")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -349,16 +398,7 @@ def display_policy_overview(free_buses, childcare, housing, grocery, revenue):
         st.markdown("#### 🛒 Government-Subsidized Grocery Stores")
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.markdown("""
-            **Proposal**: Create 5 government-run grocery stores (one per borough) with subsidized prices
-
-            **Reality**:
-            - Addresses food deserts in low-income neighborhoods
-            - Precedent: Some cities have food co-ops
-            - Operating costs + subsidies needed
-
-            **Your Scenario**: ${:.2f}B annual cost
-            """.format(grocery))
+            st.markdown(render_policy_card("government_grocery_stores", round(grocery, 2)))
         with col2:
             st.metric("Cost", f"${grocery:.2f}B")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -371,18 +411,7 @@ def display_policy_overview(free_buses, childcare, housing, grocery, revenue):
         st.markdown("#### Tax Increases on the Wealthy")
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.markdown("""
-            **Proposal**:
-            - 2% tax on NYC residents earning >$1M/year
-            - Increase corporate tax rate to 11.5%
-
-            **Reality**:
-            - ~40,000 NYC households earn >$1M
-            - Concerns about wealthy residents leaving
-            - Requires state approval for income tax changes
-
-            **Your Scenario**: ${:.2f}B annual revenue
-            """.format(revenue))
+            st.markdown(render_policy_card("tax_increases", round(revenue, 2)))
         with col2:
             st.metric("Revenue", f"${revenue:.2f}B", delta_color="normal")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -410,47 +439,110 @@ def display_policy_overview(free_buses, childcare, housing, grocery, revenue):
         st.markdown('</div>', unsafe_allow_html=True)
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
 def run_custom_simulation(num_sims, threshold, fb_mean, fb_std, cc_mean, cc_std,
                           ah_mean, ah_std, gs_mean, gs_std, rev_mean, rev_std):
     """Run simulation with custom parameters"""
 
-    # Override parameters temporarily
-    from src.parameters import PolicyParameter
+    means = np.array([fb_mean, cc_mean, ah_mean, gs_mean])
+    stds = np.array([fb_std, cc_std, ah_std, gs_std])
 
-    custom_policies = {
-        "free_buses": PolicyParameter("Free Buses", fb_mean, fb_std, "", ""),
-        "universal_childcare": PolicyParameter("Universal Childcare", cc_mean, cc_std, "", ""),
-        "affordable_housing": PolicyParameter("Affordable Housing", ah_mean, ah_std, "", ""),
-        "government_grocery_stores": PolicyParameter("Grocery Stores", gs_mean, gs_std, "", "")
-    }
+    if NUMBA_AVAILABLE:
+        from src.simulation_numba import simulation_kernel
 
-    custom_revenue = PolicyParameter("Tax Revenue", rev_mean, rev_std, "", "")
+        # Fused sample + truncate + sum + compare pass across all cores
+        samples, total_costs, revenues, net_budget_impact, threshold_exceedances = (
+            simulation_kernel(means, stds, rev_mean, rev_std, threshold, num_sims,
+                              int(np.random.default_rng().integers(2 ** 31 - 1)),
+                              np.float32, True)
+        )
+    else:
+        # float32 keeps >6 significant digits, plenty for billions to the cent;
+        # at the slider's 20,000-run maximum a process pool would only add startup
+        samples, revenues = sample_costs(
+            np.random.default_rng(), means, stds, rev_mean, rev_std, num_sims, np.float32
+        )
 
-    # Run simulation
-    policy_costs_dict = {}
-    for key, param in custom_policies.items():
-        policy_costs_dict[key] = param.sample(size=num_sims)
+        total_costs = np.empty(num_sims, dtype=np.float32)
+        samples.sum(axis=1, out=total_costs)
+        net_budget_impact = total_costs - revenues
 
-    revenues = custom_revenue.sample(size=num_sims)
-    policy_costs_df = pd.DataFrame(policy_costs_dict)
-    total_costs = policy_costs_df.sum(axis=1).values
-    net_budget_impact = total_costs - revenues
-    threshold_exceedances = np.sum(total_costs > threshold)
+    # Net impact is paired per run, so only sort the totals once it exists; the
+    # sorted copy serves the percentiles, the exceedance count and the CDF
+    total_costs.sort()
+    if not NUMBA_AVAILABLE:
+        threshold_exceedances = num_sims - np.searchsorted(total_costs, threshold, side='right')
+
+    # Reduce the per-policy samples to the scalars the tabs display, so cached
+    # results don't hold on to the (num_sims, 4) matrix
+    policy_means = samples.mean(axis=0)
+    lows, q1s, medians, q3s, highs = np.percentile(samples, [0, 25, 50, 75, 100], axis=0)
+    iqrs = q3s - q1s
+
+    total_min, total_p05, total_median, total_p95, total_max = sorted_percentiles(
+        total_costs, [0, 5, 50, 95, 100]
+    )
 
     return {
-        'policy_costs': policy_costs_df,
-        'total_costs': total_costs,
+        'policy_names': POLICY_COLUMNS,
+        'policy_means': policy_means,
+        'policy_stds': samples.std(axis=0),
+        'policy_pcts': 100 * policy_means / policy_means.sum(),
+        'policy_box': {
+            'q1': q1s,
+            'median': medians,
+            'q3': q3s,
+            'lowerfence': np.maximum(lows, q1s - 1.5 * iqrs),
+            'upperfence': np.minimum(highs, q3s + 1.5 * iqrs)
+        },
+        'total_costs': total_costs,  # sorted ascending
         'revenues': revenues,
         'net_budget_impact': net_budget_impact,
         'threshold': threshold,
         'exceedances': threshold_exceedances,
-        'num_sims': num_sims
+        'num_sims': num_sims,
+        'stats': {
+            'total_mean': total_costs.mean(),
+            'total_std': total_costs.std(),
+            'total_median': total_median,
+            'total_min': total_min,
+            'total_max': total_max,
+            'total_p05': total_p05,
+            'total_p95': total_p95,
+            'revenue_mean': revenues.mean(),
+            'revenue_std': revenues.std(),
+            'net_mean': net_budget_impact.mean()
+        }
     }
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_total_cost_table(values):
+    """Build the total cost statistics table from (mean, median, std, min, max, p5, p95)"""
+    return pd.DataFrame({
+        'Statistic': ['Mean', 'Median', 'Std Dev', 'Min', 'Max', '5th %ile', '95th %ile'],
+        'Value ($B)': [f"${value:.2f}" for value in values]
+    })
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_policy_cost_table(policy_names, policy_means, policy_pcts):
+    """Build the per-policy mean cost table"""
+    return pd.DataFrame([
+        {
+            'Policy': col.replace('_', ' ').title(),
+            'Mean Cost ($B)': f"${mean_cost:.2f}",
+            '% of Total': f"{pct:.1f}%"
+        }
+        for col, mean_cost, pct in zip(policy_names, policy_means, policy_pcts)
+    ])
+
+
 def display_results(results, threshold):
     """Display simulation results"""
 
+    stats = results['stats']
+
     st.markdown('<div class="sub-header">Simulation Results</div>', unsafe_allow_html=True)
 
     # Key metrics
@@ -459,19 +551,19 @@ def display_results(results, threshold):
     with col1:
         st.metric(
             "Mean Total Cost",
-            f"${np.mean(results['total_costs']):.2f}B",
-            delta=f"±${np.std(results['total_costs']):.2f}B"
+            f"${stats['total_mean']:.2f}B",
+            delta=f"±${stats['total_std']:.2f}B"
         )
 
     with col2:
         st.metric(
             "Mean Revenue",
-            f"${np.mean(results['revenues']):.2f}B",
-            delta=f"±${np.std(results['revenues']):.2f}B"
+            f"${stats['revenue_mean']:.2f}B",
+            delta=f"±${stats['revenue_std']:.2f}B"
         )
 
     with col3:
-        deficit = np.mean(results['net_budget_impact'])
+        deficit = stats['net_mean']
         st.metric(
             "Average Deficit",
             f"${deficit:.2f}B",
@@ -489,11 +581,11 @@ def display_results(results, threshold):
 
     # Budget analysis
     st.markdown("---")
-    if np.mean(results['net_budget_impact']) > 0:
+    if stats['net_mean'] > 0:
         st.markdown(f"""
         <div class="warning-box">
         <strong>⚠️ Budget Gap Identified</strong><br>
-        The simulation shows an average deficit of <strong>${np.mean(results['net_budget_impact']):.2f}B</strong> annually.
+        The simulation shows an average deficit of <strong>${stats['net_mean']:.2f}B</strong> annually.
         This means the proposed policies would cost more than the projected revenue from tax increases.
         </div>
         """, unsafe_allow_html=True)
@@ -501,7 +593,7 @@ def display_results(results, threshold):
         st.markdown(f"""
         <div class="success-box">
         <strong>✓ Budget Surplus</strong><br>
-        The simulation shows an average surplus of <strong>${-np.mean(results['net_budget_impact']):.2f}B</strong> annually.
+        The simulation shows an average surplus of <strong>${-stats['net_mean']:.2f}B</strong> annually.
         The proposed revenue would be sufficient to cover the policy costs.
         </div>
         """, unsafe_allow_html=True)
@@ -513,37 +605,28 @@ def display_results(results, threshold):
 
     with col1:
         st.markdown("#### Total Policy Costs")
-        stats_df = pd.DataFrame({
-            'Statistic': ['Mean', 'Median', 'Std Dev', 'Min', 'Max', '5th %ile', '95th %ile'],
-            'Value ($B)': [
-                f"${np.mean(results['total_costs']):.2f}",
-                f"${np.median(results['total_costs']):.2f}",
-                f"${np.std(results['total_costs']):.2f}",
-                f"${np.min(results['total_costs']):.2f}",
-                f"${np.max(results['total_costs']):.2f}",
-                f"${np.percentile(results['total_costs'], 5):.2f}",
-                f"${np.percentile(results['total_costs'], 95):.2f}"
-            ]
-        })
+        stats_df = build_total_cost_table((
+            float(stats['total_mean']),
+            float(stats['total_median']),
+            float(stats['total_std']),
+            float(stats['total_min']),
+            float(stats['total_max']),
+            float(stats['total_p05']),
+            float(stats['total_p95'])
+        ))
         st.dataframe(stats_df, hide_index=True, use_container_width=True)
 
     with col2:
         st.markdown("#### Individual Policy Costs (Mean)")
-        policy_stats = []
-        for col in results['policy_costs'].columns:
-            policy_name = col.replace('_', ' ').title()
-            mean_cost = np.mean(results['policy_costs'][col])
-            pct = 100 * mean_cost / np.mean(results['total_costs'])
-            policy_stats.append({
-                'Policy': policy_name,
-                'Mean Cost ($B)': f"${mean_cost:.2f}",
-                '% of Total': f"{pct:.1f}%"
-            })
-        policy_df = pd.DataFrame(policy_stats)
+        policy_df = build_policy_cost_table(
+            results['policy_names'],
+            tuple(results['policy_means'].tolist()),
+            tuple(results['policy_pcts'].tolist())
+        )
         st.dataframe(policy_df, hide_index=True, use_container_width=True)
 
     # Deficit elimination strategies
-    deficit = np.mean(results['net_budget_impact'])
+    deficit = stats['net_mean']
     if deficit > 0.1:  # Only show if there's a meaningful deficit
         st.markdown("---")
         st.markdown("### 💡 Proposed Changes to Eliminate Deficit")
@@ -564,8 +647,8 @@ def display_results(results, threshold):
             "📋 Policy Prioritization"
         ])
 
-        mean_revenue = np.mean(results['revenues'])
-        mean_total_cost = np.mean(results['total_costs'])
+        mean_revenue = stats['revenue_mean']
+        mean_total_cost = stats['total_mean']
 
         with strategy_tab1:
             st.markdown("**Revenue Increase Strategy**")
@@ -609,9 +692,8 @@ def display_results(results, threshold):
 
             # Show reduction options for each policy
             reduction_options = []
-            for col in results['policy_costs'].columns:
+            for col, mean_cost in zip(results['policy_names'], results['policy_means']):
                 policy_name = col.replace('_', ' ').title()
-                mean_cost = np.mean(results['policy_costs'][col])
                 proportional_reduction = mean_cost * (pct_reduction / 100)
                 new_cost = mean_cost - proportional_reduction
 
@@ -689,10 +771,10 @@ def display_results(results, threshold):
 
             # Calculate what policies could be implemented within revenue
             policies_sorted = []
-            for col in results['policy_costs'].columns:
+            for col, mean_cost, pct_of_total in zip(
+                results['policy_names'], results['policy_means'], results['policy_pcts']
+            ):
                 policy_name = col.replace('_', ' ').title()
-                mean_cost = np.mean(results['policy_costs'][col])
-                pct_of_total = 100 * mean_cost / mean_total_cost
 
                 policies_sorted.append({
                     'policy': policy_name,
@@ -758,18 +840,26 @@ def display_results(results, threshold):
         """)
 
 
+def histogram_bar(data, bins=50, **kwargs):
+    """Bin data once in NumPy and return a bar trace, so Plotly only receives the bin counts"""
+    counts, edges = np.histogram(data, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    return go.Bar(x=centers, y=counts, width=edges[1] - edges[0], **kwargs)
+
+
 def display_visualizations(results, threshold):
     """Display interactive visualizations"""
 
+    stats = results['stats']
+
     st.markdown('<div class="sub-header">Interactive Visualizations</div>', unsafe_allow_html=True)
 
     # Chart 1: Total Cost Distribution
     st.markdown("#### Distribution of Total Policy Costs")
     fig1 = go.Figure()
 
-    fig1.add_trace(go.Histogram(
-        x=results['total_costs'],
-        nbinsx=50,
+    fig1.add_trace(histogram_bar(
+        results['total_costs'],
         name='Total Costs',
         marker_color='steelblue',
         opacity=0.7
@@ -784,10 +874,10 @@ def display_visualizations(results, threshold):
     )
 
     fig1.add_vline(
-        x=np.mean(results['total_costs']),
+        x=stats['total_mean'],
         line_dash="dash",
         line_color="green",
-        annotation_text=f"Mean: ${np.mean(results['total_costs']):.2f}B",
+        annotation_text=f"Mean: ${stats['total_mean']:.2f}B",
         annotation_position="top left"
     )
 
@@ -796,6 +886,7 @@ def display_visualizations(results, threshold):
         yaxis_title="Frequency",
         title="Monte Carlo Simulation: Total Policy Cost Distribution",
         template="plotly_white",
+        uirevision="const",
         height=400
     )
 
@@ -806,20 +897,23 @@ def display_visualizations(results, threshold):
 
     fig2 = go.Figure()
 
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
-    for idx, col in enumerate(results['policy_costs'].columns):
-        policy_name = col.replace('_', ' ').title()
-        fig2.add_trace(go.Box(
-            y=results['policy_costs'][col],
-            name=policy_name,
-            marker_color=colors[idx],
-            boxmean='sd'
-        ))
+    # One trace holding all four boxes, built from precomputed statistics
+    policy_labels = [col.replace('_', ' ').title() for col in results['policy_names']]
+    fig2.add_trace(go.Box(
+        x=policy_labels,
+        **results['policy_box'],
+        mean=results['policy_means'],
+        sd=results['policy_stds'],
+        marker_color='steelblue',
+        boxmean='sd',
+        showlegend=False
+    ))
 
     fig2.update_layout(
         yaxis_title="Cost (Billions USD)",
         title="Policy Cost Distributions (Box Plots)",
         template="plotly_white",
+        uirevision="const",
         height=400
     )
 
@@ -832,9 +926,8 @@ def display_visualizations(results, threshold):
         st.markdown("#### Net Budget Impact Distribution")
         fig3 = go.Figure()
 
-        fig3.add_trace(go.Histogram(
-            x=results['net_budget_impact'],
-            nbinsx=50,
+        fig3.add_trace(histogram_bar(
+            results['net_budget_impact'],
             marker_color='coral',
             opacity=0.7
         ))
@@ -846,6 +939,7 @@ def display_visualizations(results, threshold):
             xaxis_title="Net Impact (Billions USD)",
             yaxis_title="Frequency",
             template="plotly_white",
+            uirevision="const",
             height=400
         )
 
@@ -854,26 +948,25 @@ def display_visualizations(results, threshold):
     with col2:
         st.markdown("#### Costs vs Revenue")
 
-        comparison_data = pd.DataFrame({
-            'Category': ['Total Costs', 'Revenue'],
-            'Mean': [np.mean(results['total_costs']), np.mean(results['revenues'])],
-            'Std': [np.std(results['total_costs']), np.std(results['revenues'])]
-        })
+        categories = ['Total Costs', 'Revenue']
+        comparison_means = [stats['total_mean'], stats['revenue_mean']]
+        comparison_stds = [stats['total_std'], stats['revenue_std']]
 
         fig4 = go.Figure()
 
         fig4.add_trace(go.Bar(
-            x=comparison_data['Category'],
-            y=comparison_data['Mean'],
-            error_y=dict(type='data', array=comparison_data['Std']),
+            x=categories,
+            y=comparison_means,
+            error_y=dict(type='data', array=comparison_stds),
             marker_color=['#e74c3c', '#27ae60'],
-            text=[f"${val:.2f}B" for val in comparison_data['Mean']],
+            text=[f"${val:.2f}B" for val in comparison_means],
             textposition='outside'
         ))
 
         fig4.update_layout(
             yaxis_title="Amount (Billions USD)",
             template="plotly_white",
+            uirevision="const",
             height=400,
             showlegend=False
         )
@@ -883,13 +976,14 @@ def display_visualizations(results, threshold):
     # Chart 4: Cumulative Distribution
     st.markdown("#### Cumulative Probability Distribution")
 
-    sorted_costs = np.sort(results['total_costs'])
-    cumulative_prob = np.arange(1, len(sorted_costs) + 1) / len(sorted_costs)
+    # A CDF is monotone, so a few hundred quantiles trace it as well as all N points
+    cumulative_prob = np.linspace(1 / CDF_POINTS, 1, CDF_POINTS)
+    cdf_costs = sorted_percentiles(results['total_costs'], 100 * cumulative_prob)
 
     fig5 = go.Figure()
 
     fig5.add_trace(go.Scatter(
-        x=sorted_costs,
+        x=cdf_costs,
         y=cumulative_prob,
         mode='lines',
         line=dict(color='steelblue', width=2),
@@ -908,6 +1002,7 @@ def display_visualizations(results, threshold):
         yaxis_title="Cumulative Probability",
         title="Cumulative Distribution Function",
         template="plotly_white",
+        uirevision="const",
         height=400
     )
 
@@ -917,9 +1012,11 @@ def display_visualizations(results, threshold):
 def display_insights(results):
     """Display insights and recommendations"""
 
+    stats = results['stats']
+
     st.markdown('<div class="sub-header">Insights & Recommendations</div>', unsafe_allow_html=True)
 
-    deficit = np.mean(results['net_budget_impact'])
+    deficit = stats['net_mean']
 
     st.markdown("### 🔍 Key Findings")
 
@@ -929,17 +1026,17 @@ def display_insights(results):
         st.markdown("#### Budget Reality")
         st.markdown(f"""
         - **Average Deficit**: ${deficit:.2f}B annually
-        - **Revenue Coverage**: {100 * np.mean(results['revenues']) / np.mean(results['total_costs']):.1f}% of costs
+        - **Revenue Coverage**: {100 * stats['revenue_mean'] / stats['total_mean']:.1f}% of costs
         - **Threshold Exceedance**: {100 * results['exceedances'] / results['num_sims']:.1f}% of simulations
         - **Risk Level**: {"High" if deficit > 5 else "Moderate" if deficit > 2 else "Low"}
         """)
 
     with col2:
         st.markdown("#### Policy Breakdown")
-        for col in results['policy_costs'].columns:
+        for col, mean_cost, pct in zip(
+            results['policy_names'], results['policy_means'], results['policy_pcts']
+        ):
             policy_name = col.replace('_', ' ').title()
-            mean_cost = np.mean(results['policy_costs'][col])
-            pct = 100 * mean_cost / np.mean(results['total_costs'])
             st.markdown(f"- **{policy_name}**: ${mean_cost:.2f}B ({pct:.1f}%)")
 
     st.markdown("---")
@@ -3,7 +3,7 @@
 Main entry point for Mamdani Policy Monte Carlo Simulation
 
 Usage:
-    python main.py [--simulations N] [--threshold T] [--seed S]
+    python main.py [--simulations N] [--threshold T] [--seed S] [--numba] [--keep-samples] [--publication] [--format {png,svg}] [--plot-workers N] [--no-viz]
 """
 
 import argparse
@@ -11,15 +11,27 @@ import sys
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.config import (
     DEFAULT_NUM_SIMULATIONS,
     DEFAULT_BUDGET_THRESHOLD,
     DEFAULT_RANDOM_SEED,
-    RESULTS_DIR
+    RESULTS_DIR,
+    FIGURE_DPI,
+    FAST_DPI,
+    SAVE_FORMAT
+)
+from src.parameters import (
+    validate_parameters,
+    get_total_policy_costs,
+    get_policy_summary
 )
-from src.parameters import validate_parameters, get_total_policy_costs, get_policy_summary
 from src.simulation import MonteCarloSimulator, run_sensitivity_analysis
-from src.visualization import SimulationVisualizer
 
 
 def parse_arguments():
@@ -54,6 +66,39 @@ def parse_arguments():
         help=f'Random seed for reproducibility (default: {DEFAULT_RANDOM_SEED})'
     )
 
+    parser.add_argument(
+        '--numba',
+        action='store_true',
+        help='Run the sampling loop with the compiled Numba kernel (requires numba)'
+    )
+
+    parser.add_argument(
+        '--keep-samples',
+        action='store_true',
+        help='Keep per-policy samples with --no-viz (visualizations always keep them)'
+    )
+
+    parser.add_argument(
+        '--publication',
+        action='store_true',
+        help=f'Save figures at {FIGURE_DPI} DPI instead of {FAST_DPI}'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices=['png', 'svg'],
+        default=SAVE_FORMAT,
+        help=f'File format for saved figures (default: {SAVE_FORMAT})'
+    )
+
+    parser.add_argument(
+        '--plot-workers',
+        type=int,
+        default=1,
+        help='Render plots in this many worker processes (default: 1, serial; '
+             'each worker adds ~2 s of startup, so only worth it for large runs)'
+    )
+
     parser.add_argument(
         '--no-viz',
         action='store_true',
@@ -78,21 +123,23 @@ def print_policy_overview():
     """
     Print overview of policies being analyzed
     """
-    print("\n" + "-" * 70)
-    print("POLICY OVERVIEW")
-    print("-" * 70)
+    out = ["\n" + "-" * 70, "POLICY OVERVIEW", "-" * 70]
 
     summary = get_policy_summary()
     total_mean, total_std = get_total_policy_costs()
 
-    for policy_key, stats in summary.items():
-        print(f"\n{stats['name']}:")
-        print(f"  Mean Cost: ${stats['mean']:.2f}B ± ${stats['std_dev']:.2f}B")
-        print(f"  Range (±2σ): ${stats['min_estimate']:.2f}B - ${stats['max_estimate']:.2f}B")
+    out.extend(
+        f"\n{stats['name']}:\n"
+        f"  Mean Cost: ${stats['mean']:.2f}B ± ${stats['std_dev']:.2f}B\n"
+        f"  Range (±2σ): ${stats['min_estimate']:.2f}B - ${stats['max_estimate']:.2f}B"
+        for stats in summary.values()
+    )
+
+    out.append(f"\nTotal Expected Cost: ${total_mean:.2f}B ± ${total_std:.2f}B")
+    out.append("Proposed Revenue: $10.0B ± $1.5B (from tax increases)")
+    out.append(f"Expected Budget Gap: ${total_mean - 10.0:.2f}B")
 
-    print(f"\nTotal Expected Cost: ${total_mean:.2f}B ± ${total_std:.2f}B")
-    print(f"Proposed Revenue: $10.0B ± $1.5B (from tax increases)")
-    print(f"Expected Budget Gap: ${total_mean - 10.0:.2f}B")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def save_results_to_json(results, sensitivity, output_dir: str = RESULTS_DIR):
@@ -113,8 +160,17 @@ def save_results_to_json(results, sensitivity, output_dir: str = RESULTS_DIR):
     }
 
     json_path = output_path / 'simulation_results.json'
-    with open(json_path, 'w') as f:
-        json.dump(results_dict, f, indent=2)
+    if ORJSON_AVAILABLE:
+        # Serialize to bytes in C and write them in one call
+        payload = orjson.dumps(
+            results_dict,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+        with open(json_path, 'wb') as f:
+            f.write(payload)
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(results_dict, f, indent=2)
 
     print(f"\nResults saved to: {json_path}")
 
@@ -144,7 +200,10 @@ def main():
     simulator = MonteCarloSimulator(
         num_simulations=args.simulations,
         budget_threshold=args.threshold,
-        random_seed=args.seed
+        random_seed=args.seed,
+        use_numba=args.numba,
+        # The per-policy plots need the samples; otherwise stream the statistics
+        keep_samples=args.keep_samples or not args.no_viz
     )
 
     print("\n" + "-" * 70)
@@ -172,8 +231,15 @@ def main():
         print("GENERATING VISUALIZATIONS")
         print("-" * 70)
 
-        visualizer = SimulationVisualizer(results)
-        visualizer.create_all_visualizations()
+        # Plotting libraries are slow to import, so skip them with --no-viz
+        from src.visualization import SimulationVisualizer
+
+        visualizer = SimulationVisualizer(
+            results,
+            dpi=FIGURE_DPI if args.publication else FAST_DPI,
+            save_format=args.format
+        )
+        visualizer.create_all_visualizations(max_workers=args.plot_workers)
         visualizer.plot_sensitivity_analysis(sensitivity)
 
         print("\n✓ All visualizations generated successfully!")
@@ -2,24 +2,31 @@
 Configuration file for Mamdani Policy Monte Carlo Simulation
 """
 
+import numpy as np
+
 # Simulation parameters
 DEFAULT_NUM_SIMULATIONS = 10000
 DEFAULT_RANDOM_SEED = 42
 DEFAULT_BUDGET_THRESHOLD = 2.0  # in billions
+SAMPLE_CHUNK_SIZE = 65536  # simulations drawn per block when samples are not kept
+MEDIAN_HISTOGRAM_BINS = 4096  # bins per policy for streaming median estimates
 
 # Output settings
 RESULTS_DIR = "results"
-FIGURE_DPI = 300
+FIGURE_DPI = 300  # publication quality, used with --publication
+FAST_DPI = 120  # default for everyday runs
 FIGURE_FORMAT = ["png", "html"]
+SAVE_FORMAT = "png"  # "png", or "svg" with data layers rasterized and text kept vector
 
 # Statistical settings
 CONFIDENCE_LEVEL = 0.95
-PERCENTILES = [5, 25, 50, 75, 95]
+PERCENTILES = np.array([5, 25, 50, 75, 95])  # integer so result keys stay 5, 25, ...
 
 # Visualization settings
 COLOR_PALETTE = "husl"
 PLOT_STYLE = "whitegrid"
 FIGURE_SIZE = (12, 8)
+CDF_MAX_POINTS = 2000  # CDF traces are downsampled to at most this many points
 
 # NYC Budget context (in billions)
 NYC_CURRENT_BUDGET = 118.0
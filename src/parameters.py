@@ -2,8 +2,10 @@
 Policy parameter definitions with uncertainty distributions
 """
 
+import math
 import numpy as np
-from typing import Dict, Tuple
+from functools import cache
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -25,23 +27,37 @@ class PolicyParameter:
     description: str
     source: str
 
-    def sample(self, size: int = 1, seed: int = None) -> np.ndarray:
+    def sample(
+        self,
+        size: int = 1,
+        rng: Optional[np.random.Generator] = None,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
         """
         Sample from the policy cost distribution
 
         Args:
             size: Number of samples to generate
-            seed: Random seed for reproducibility
+            rng: NumPy random Generator (default: a new one seeded with seed)
+            seed: Random seed for reproducibility, used when rng is not given
 
         Returns:
-            Array of sampled costs (ensuring non-negative values)
+            Array of sampled costs from the normal distribution truncated at zero
         """
-        if seed is not None:
-            np.random.seed(seed)
+        if rng is None:
+            rng = np.random.default_rng(seed)
 
-        # Use normal distribution and truncate at zero (costs can't be negative)
-        samples = np.random.normal(self.mean, self.std_dev, size)
-        return np.maximum(samples, 0)
+        if self.std_dev == 0:
+            return np.full(size, float(self.mean))
+
+        # scipy.stats is slow to import, so load it only when sampling this way
+        from scipy.stats import truncnorm
+
+        # Costs can't be negative: truncate rather than clip so no mass piles up at zero
+        return truncnorm.rvs(
+            -self.mean / self.std_dev, np.inf,
+            loc=self.mean, scale=self.std_dev, size=size, random_state=rng
+        )
 
 
 # Policy cost parameters (all values in billions USD)
@@ -92,41 +108,210 @@ REVENUE_PARAMETERS = {
 }
 
 
+# Column order of the policy cost matrix returned by sample_all
+POLICY_KEYS = tuple(POLICY_PARAMETERS)
+
+# Every (key, parameter) pair, policies first, for validation
+_ALL_PARAMS = (*POLICY_PARAMETERS.items(), *REVENUE_PARAMETERS.items())
+
+# Policy means and standard deviations in POLICY_KEYS order, frozen at import;
+# read-only because they are shared with every caller and simulation
+MU = np.fromiter((param.mean for param in POLICY_PARAMETERS.values()), float, len(POLICY_KEYS))
+SIGMA = np.fromiter((param.std_dev for param in POLICY_PARAMETERS.values()), float, len(POLICY_KEYS))
+MU.flags.writeable = False
+SIGMA.flags.writeable = False
+
+# Assuming policies are independent, the total's variance is the sum of variances
+TOTAL_MEAN = float(MU.sum())
+TOTAL_STD = float(np.sqrt((SIGMA ** 2).sum()))
+
+
+def truncated_normal_variance(means: np.ndarray, stds: np.ndarray) -> np.ndarray:
+    """
+    Closed-form variance of normals truncated at zero, as sample_costs draws them
+
+    With alpha = -mean / std and lambda = pdf(alpha) / (1 - cdf(alpha)) the
+    variance is std^2 * (1 + alpha * lambda - lambda^2).
+
+    Args:
+        means: Means of the untruncated normals
+        stds: Standard deviations of the untruncated normals
+
+    Returns:
+        Array of variances; zero where the standard deviation is zero
+    """
+    variances = []
+    for mean, std in np.broadcast(means, stds):
+        if std <= 0:
+            variances.append(0.0)
+            continue
+
+        alpha = -mean / std
+        pdf = math.exp(-alpha * alpha / 2) / math.sqrt(2 * math.pi)
+        tail = math.erfc(alpha / math.sqrt(2)) / 2
+        hazard = pdf / tail
+        variances.append(std * std * (1 + alpha * hazard - hazard * hazard))
+
+    return np.array(variances).reshape(np.broadcast(means, stds).shape)
+
+
+# Variance each policy contributes to the total cost
+POLICY_VARIANCES = truncated_normal_variance(MU, SIGMA)
+POLICY_VARIANCES.flags.writeable = False
+
+
+def sample_costs(
+    rng: np.random.Generator,
+    means: np.ndarray,
+    stds: np.ndarray,
+    rev_mean: float,
+    rev_std: float,
+    size: int,
+    dtype: type = np.float64
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample every policy cost and the revenue from one shared generator
+
+    All policies are drawn in a single (size, K) call; negative draws are
+    redrawn in place, so each column follows a normal truncated at zero.
+
+    Args:
+        rng: NumPy random Generator
+        means: Mean cost of each policy in billions
+        stds: Standard deviation of each policy in billions
+        rev_mean: Mean revenue in billions
+        rev_std: Revenue standard deviation in billions
+        size: Number of simulation runs
+        dtype: Floating point type of the returned arrays (float32 or float64)
+
+    Returns:
+        Tuple of (policy_costs, revenues) with shapes (size, K) and (size,)
+    """
+    policy_costs = rng.standard_normal((size, len(means)), dtype=dtype)
+    policy_costs *= np.asarray(stds, dtype=dtype)
+    policy_costs += np.asarray(means, dtype=dtype)
+    _redraw_negative(rng, policy_costs, means, stds)
+
+    revenues = rng.standard_normal(size, dtype=dtype)
+    revenues *= dtype(rev_std)
+    revenues += dtype(rev_mean)
+    _redraw_negative(rng, revenues, rev_mean, rev_std)
+
+    return policy_costs, revenues
+
+
+def _redraw_negative(rng: np.random.Generator, samples: np.ndarray, means, stds):
+    """
+    Redraw negative normal samples in place until none remain
+
+    Rejection sampling gives an exact normal truncated at zero. With
+    non-negative means at least half of each round is accepted, and for
+    realistic parameters negatives are rare, so this costs one comparison
+    pass plus a handful of redraws -- far cheaper than scipy's truncnorm.
+
+    Args:
+        rng: NumPy random Generator
+        samples: Array of shape (size,) or (size, K), modified in place
+        means: Scalar mean or per-column means (must be non-negative)
+        stds: Scalar standard deviation or per-column standard deviations
+    """
+    flat = samples.reshape(-1)
+    means = np.atleast_1d(means)
+    stds = np.atleast_1d(stds)
+
+    negative = np.flatnonzero(flat < 0)
+    while negative.size:
+        columns = negative % means.size
+        redraw = rng.standard_normal(negative.size, dtype=flat.dtype)
+        redraw *= stds[columns]
+        redraw += means[columns]
+        flat[negative] = redraw
+        negative = negative[redraw < 0]
+
+
+def sample_all(
+    rng: np.random.Generator,
+    size: int,
+    dtype: type = np.float32
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample every policy cost and the tax revenue from the configured parameters
+
+    Costs are reported to two decimals of billions, well within float32's
+    ~7 significant digits, so the default halves memory traffic for free.
+
+    Args:
+        rng: NumPy random Generator
+        size: Number of samples to generate
+        dtype: Floating point type of the returned arrays (float32 or float64)
+
+    Returns:
+        Tuple of (policy_costs, revenues) with shapes (size, K) and (size,);
+        policy columns follow POLICY_KEYS order
+    """
+    revenue_param = REVENUE_PARAMETERS["tax_increases"]
+
+    return sample_costs(
+        rng,
+        MU,
+        SIGMA,
+        revenue_param.mean,
+        revenue_param.std_dev,
+        size,
+        dtype
+    )
+
+
+@cache
 def get_total_policy_costs() -> Tuple[float, float]:
     """
     Calculate total mean and combined standard deviation for all policies
 
+    The result is cached, so POLICY_PARAMETERS must not be modified
+    after import.
+
     Returns:
         Tuple of (mean_total, std_dev_total) in billions
     """
-    mean_total = sum(param.mean for param in POLICY_PARAMETERS.values())
+    return TOTAL_MEAN, TOTAL_STD
 
-    # Assuming policies are independent, combine variances
-    variance_total = sum(param.std_dev ** 2 for param in POLICY_PARAMETERS.values())
-    std_dev_total = np.sqrt(variance_total)
 
-    return mean_total, std_dev_total
+def get_policy_summary_arrays() -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get summary statistics for all policies as arrays in POLICY_KEYS order
+
+    Returns:
+        Tuple of (policy_keys, means, std_devs, min_estimates, max_estimates);
+        the estimates span ±2σ, floored at zero
+    """
+    return POLICY_KEYS, MU, SIGMA, np.maximum(MU - 2 * SIGMA, 0), MU + 2 * SIGMA
 
 
+@cache
 def get_policy_summary() -> Dict[str, Dict[str, float]]:
     """
     Get summary statistics for all policies
 
+    The result is cached and shared between callers, so treat it as read-only;
+    POLICY_PARAMETERS must not be modified after import.
+
     Returns:
         Dictionary with policy names and their statistics
     """
-    summary = {}
-
-    for key, param in POLICY_PARAMETERS.items():
-        summary[key] = {
-            "name": param.name,
-            "mean": param.mean,
-            "std_dev": param.std_dev,
-            "min_estimate": max(0, param.mean - 2 * param.std_dev),
-            "max_estimate": param.mean + 2 * param.std_dev
+    keys, means, std_devs, min_estimates, max_estimates = get_policy_summary_arrays()
+
+    return {
+        key: {
+            "name": POLICY_PARAMETERS[key].name,
+            "mean": mean,
+            "std_dev": std_dev,
+            "min_estimate": min_estimate,
+            "max_estimate": max_estimate
         }
-
-    return summary
+        for key, mean, std_dev, min_estimate, max_estimate in zip(
+            keys, means.tolist(), std_devs.tolist(), min_estimates.tolist(), max_estimates.tolist()
+        )
+    }
 
 
 def validate_parameters() -> bool:
@@ -139,7 +324,7 @@ def validate_parameters() -> bool:
     Raises:
         ValueError if any parameter is invalid
     """
-    for key, param in {**POLICY_PARAMETERS, **REVENUE_PARAMETERS}.items():
+    for key, param in _ALL_PARAMS:
         if param.mean < 0:
             raise ValueError(f"Parameter {key} has negative mean: {param.mean}")
 
@@ -147,7 +332,7 @@ def validate_parameters() -> bool:
             raise ValueError(f"Parameter {key} has negative std_dev: {param.std_dev}")
 
         if param.std_dev > param.mean:
-            print(f"Warning: {key} has std_dev > mean, may produce many zero values")
+            print(f"Warning: {key} has std_dev > mean, truncation at zero will raise its mean")
 
     return True
 
@@ -2,20 +2,41 @@
 Monte Carlo simulation engine for policy cost analysis
 """
 
+import sys
 import numpy as np
-import pandas as pd
+from importlib.util import find_spec
+from multiprocessing import cpu_count, get_context
 from typing import Dict, Tuple, Optional
 from dataclasses import dataclass
-from scipy import stats
+from statistics import NormalDist
 
-from .parameters import POLICY_PARAMETERS, REVENUE_PARAMETERS
+from .parameters import (
+    POLICY_PARAMETERS, REVENUE_PARAMETERS, POLICY_KEYS, MU, SIGMA, POLICY_VARIANCES,
+    sample_all, sample_costs
+)
 from .config import (
     DEFAULT_NUM_SIMULATIONS,
     DEFAULT_BUDGET_THRESHOLD,
     CONFIDENCE_LEVEL,
-    PERCENTILES
+    PERCENTILES,
+    SAMPLE_CHUNK_SIZE,
+    MEDIAN_HISTOGRAM_BINS
 )
 
+# Checked without importing numba, which takes ~170 ms; the kernel module is
+# only imported when the Numba path actually runs
+NUMBA_AVAILABLE = find_spec("numba") is not None
+
+# Two-sided critical value of the normal distribution at CONFIDENCE_LEVEL
+_Z_CRITICAL = NormalDist().inv_cdf(1 - (1 - CONFIDENCE_LEVEL) / 2)
+
+# Below this sample size confidence intervals use the t distribution instead
+T_INTERVAL_MAX_SAMPLES = 30
+
+# Min, PERCENTILES and max as one vector, and the percentile keys of the summary
+_SUMMARY_QUANTILES = np.concatenate(([0], PERCENTILES, [100]))
+_PERCENTILE_KEYS = PERCENTILES.tolist()
+
 
 @dataclass
 class SimulationResults:
@@ -23,15 +44,21 @@ class SimulationResults:
     Container for simulation results
 
     Attributes:
-        policy_costs: DataFrame with costs for each policy in each simulation
+        policy_costs: Array of shape (num_simulations, K) with costs for each
+            policy, or None when the simulator was run without keep_samples
+        policy_keys: Policy keys in the column order of policy_costs
         total_costs: Array of total costs for each simulation
+        sorted_total_costs: Read-only copy of total_costs sorted ascending,
+            shared by the statistics and the visualizations
         revenues: Array of revenues for each simulation
         net_budget_impact: Array of net impact (costs - revenues)
         threshold_exceedances: Number of times threshold was exceeded
         statistics: Dictionary of summary statistics
     """
-    policy_costs: pd.DataFrame
+    policy_costs: Optional[np.ndarray]
+    policy_keys: Tuple[str, ...]
     total_costs: np.ndarray
+    sorted_total_costs: np.ndarray
     revenues: np.ndarray
     net_budget_impact: np.ndarray
     threshold_exceedances: int
@@ -47,7 +74,10 @@ class MonteCarloSimulator:
         self,
         num_simulations: int = DEFAULT_NUM_SIMULATIONS,
         budget_threshold: float = DEFAULT_BUDGET_THRESHOLD,
-        random_seed: Optional[int] = None
+        random_seed: Optional[int] = None,
+        use_numba: bool = False,
+        keep_samples: bool = True,
+        dtype: type = np.float32
     ):
         """
         Initialize the Monte Carlo simulator
@@ -56,13 +86,37 @@ class MonteCarloSimulator:
             num_simulations: Number of simulation runs
             budget_threshold: Budget threshold in billions
             random_seed: Random seed for reproducibility
+            use_numba: Run the sampling loop with the Numba kernel when Numba is installed
+            keep_samples: Keep the (num_simulations, K) per-policy cost matrix in
+                the results; when False, per-policy statistics are accumulated
+                chunk by chunk and the matrix is never held in memory
+            dtype: Floating point type of the sampled arrays; summary statistics
+                are always accumulated in float64
         """
         self.num_simulations = num_simulations
         self.budget_threshold = budget_threshold
         self.random_seed = random_seed
+        self.seed_sequence = np.random.SeedSequence(random_seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+
+        if use_numba and not NUMBA_AVAILABLE:
+            print("Warning: Numba is not installed, falling back to the NumPy sampler")
+        self.use_numba = use_numba and NUMBA_AVAILABLE
+        self.keep_samples = keep_samples
+        self.dtype = dtype
+
+    def spawn_rng(self) -> np.random.Generator:
+        """
+        Create an independent generator for a sub-simulation
 
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        Children are spawned from the simulator's SeedSequence, so sweeps such
+        as perturbed sensitivity runs are reproducible for a given seed and
+        never reseed or advance the main generator.
+
+        Returns:
+            NumPy random Generator with its own PCG64 stream
+        """
+        return np.random.default_rng(self.seed_sequence.spawn(1)[0])
 
     def run_simulation(self) -> SimulationResults:
         """
@@ -73,100 +127,253 @@ class MonteCarloSimulator:
         """
         print(f"Running {self.num_simulations:,} Monte Carlo simulations...")
 
-        # Initialize storage for results
-        policy_costs_dict = {}
-
-        # Sample costs for each policy
-        for policy_key, policy_param in POLICY_PARAMETERS.items():
-            costs = policy_param.sample(size=self.num_simulations)
-            policy_costs_dict[policy_key] = costs
-            print(f"  Sampled {policy_param.name}: μ={costs.mean():.3f}B, σ={costs.std():.3f}B")
+        if self.use_numba and self.keep_samples:
+            policy_costs, total_costs, revenues = self._run_numba_kernel()
+            policy_moments = self._policy_moments(policy_costs)
+        elif self.use_numba:
+            total_costs, revenues, policy_moments = self._run_numba_streaming()
+        elif self.keep_samples:
+            # Sample all policies and revenue in one batched draw
+            policy_costs, revenues = sample_all(self.rng, self.num_simulations, self.dtype)
+
+            total_costs = policy_costs.sum(axis=1)
+            policy_moments = self._policy_moments(policy_costs)
+        else:
+            total_costs, revenues, policy_moments = self._run_streaming()
 
-        # Sample revenues
-        revenue_param = REVENUE_PARAMETERS["tax_increases"]
-        revenues = revenue_param.sample(size=self.num_simulations)
-        print(f"  Sampled {revenue_param.name}: μ={revenues.mean():.3f}B, σ={revenues.std():.3f}B")
+        if not self.keep_samples:
+            policy_costs = None
 
-        # Convert to DataFrame
-        policy_costs_df = pd.DataFrame(policy_costs_dict)
+        policy_means, policy_stds, _ = policy_moments
+        for policy_key, mean, std in zip(POLICY_KEYS, policy_means, policy_stds):
+            print(f"  Sampled {POLICY_PARAMETERS[policy_key].name}: μ={mean:.3f}B, σ={std:.3f}B")
 
-        # Calculate total costs
-        total_costs = policy_costs_df.sum(axis=1).values
+        revenue_param = REVENUE_PARAMETERS["tax_increases"]
+        print(f"  Sampled {revenue_param.name}: "
+              f"μ={revenues.mean(dtype=np.float64):.3f}B, σ={revenues.std(dtype=np.float64):.3f}B")
 
         # Calculate net budget impact (positive means deficit)
         net_budget_impact = total_costs - revenues
 
-        # Count threshold exceedances
-        threshold_exceedances = np.sum(total_costs > self.budget_threshold)
+        # Sort the totals once; statistics and plots all read the sorted copy
+        sorted_total_costs = np.sort(total_costs)
+        sorted_total_costs.setflags(write=False)
 
         # Calculate statistics
         statistics = self._calculate_statistics(
-            policy_costs_df, total_costs, revenues, net_budget_impact, threshold_exceedances
+            policy_moments, sorted_total_costs, revenues, net_budget_impact
         )
 
         print("\nSimulation complete!")
 
         return SimulationResults(
-            policy_costs=policy_costs_df,
+            policy_costs=policy_costs,
+            policy_keys=POLICY_KEYS,
             total_costs=total_costs,
+            sorted_total_costs=sorted_total_costs,
             revenues=revenues,
             net_budget_impact=net_budget_impact,
-            threshold_exceedances=threshold_exceedances,
+            threshold_exceedances=statistics["threshold_analysis"]["exceedances"],
             statistics=statistics
         )
 
+    def _run_numba_kernel(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sample costs and revenues with the compiled Numba kernel
+
+        Returns:
+            Tuple of (policy_costs, total_costs, revenues)
+        """
+        from .simulation_numba import simulation_kernel
+
+        revenue_param = REVENUE_PARAMETERS["tax_increases"]
+
+        # Exceedances are counted from the sorted totals in _calculate_statistics
+        policy_costs, total_costs, revenues, _, _ = simulation_kernel(
+            MU,
+            SIGMA,
+            revenue_param.mean,
+            revenue_param.std_dev,
+            self.budget_threshold,
+            self.num_simulations,
+            int(self.rng.integers(2 ** 31 - 1)),
+            self.dtype,
+            False
+        )
+        return policy_costs, total_costs, revenues
+
+    def _run_numba_streaming(self) -> Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, ...]]:
+        """
+        Numba counterpart of _run_streaming, for runs that don't keep samples
+
+        The kernel returns per-chunk means and squared-deviation sums, merged
+        here the same way _run_streaming merges its blocks, and per-thread
+        histograms that are summed for the median estimates.
+
+        Returns:
+            Tuple of (total_costs, revenues, (policy_means, policy_stds, policy_medians))
+        """
+        from numba import get_num_threads
+        from .simulation_numba import streaming_kernel
+
+        revenue_param = REVENUE_PARAMETERS["tax_increases"]
+        lows, bin_widths = self._median_histogram_bins()
+
+        total_costs, revenues, counts, chunk_means, chunk_m2, histograms = streaming_kernel(
+            MU,
+            SIGMA,
+            revenue_param.mean,
+            revenue_param.std_dev,
+            self.num_simulations,
+            int(self.rng.integers(2 ** 31 - 1)),
+            self.dtype,
+            lows,
+            bin_widths,
+            MEDIAN_HISTOGRAM_BINS,
+            get_num_threads()
+        )
+
+        # Chan et al.'s merge of all chunks at once
+        weights = counts[:, None]
+        means = (weights * chunk_means).sum(axis=0) / self.num_simulations
+        m2 = chunk_m2.sum(axis=0) + (weights * (chunk_means - means) ** 2).sum(axis=0)
+        stds = np.sqrt(m2 / (self.num_simulations - 1))
+        medians = self._histogram_medians(histograms.sum(axis=0), lows, bin_widths)
+
+        return total_costs, revenues, (means, stds, medians)
+
+    @staticmethod
+    def _median_histogram_bins() -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bins for streaming median estimates: MEDIAN_HISTOGRAM_BINS per policy,
+        spanning six standard deviations either side of each mean
+
+        Returns:
+            Tuple of (lows, bin_widths), one entry per policy
+        """
+        lows = np.maximum(MU - 6 * SIGMA, 0.0)
+        highs = MU + 6 * SIGMA
+        return lows, (highs - lows) / MEDIAN_HISTOGRAM_BINS
+
+    def _run_streaming(self) -> Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, ...]]:
+        """
+        Sample in blocks of SAMPLE_CHUNK_SIZE without keeping per-policy costs
+
+        Per-policy means and variances are merged block by block (Chan et al.'s
+        parallel form of Welford's update); medians come from the fixed-bin
+        histograms of _median_histogram_bins.
+
+        Returns:
+            Tuple of (total_costs, revenues, (policy_means, policy_stds, policy_medians))
+        """
+        num_policies = len(POLICY_KEYS)
+        total_costs = np.empty(self.num_simulations, dtype=self.dtype)
+        revenues = np.empty(self.num_simulations, dtype=self.dtype)
+
+        count = 0
+        means = np.zeros(num_policies)
+        m2 = np.zeros(num_policies)
+
+        lows, bin_widths = self._median_histogram_bins()
+        bin_offsets = np.arange(num_policies) * MEDIAN_HISTOGRAM_BINS
+        histograms = np.zeros(num_policies * MEDIAN_HISTOGRAM_BINS, dtype=np.int64)
+
+        for start in range(0, self.num_simulations, SAMPLE_CHUNK_SIZE):
+            stop = min(start + SAMPLE_CHUNK_SIZE, self.num_simulations)
+            chunk_costs, revenues[start:stop] = sample_all(self.rng, stop - start, self.dtype)
+            chunk_costs.sum(axis=1, out=total_costs[start:stop])
+
+            chunk_count = stop - start
+            chunk_means = chunk_costs.mean(axis=0, dtype=np.float64)
+            chunk_m2 = ((chunk_costs - chunk_means) ** 2).sum(axis=0)
+            delta = chunk_means - means
+            merged_count = count + chunk_count
+            means += delta * (chunk_count / merged_count)
+            m2 += chunk_m2 + delta ** 2 * (count * chunk_count / merged_count)
+            count = merged_count
+
+            bins = ((chunk_costs - lows) / bin_widths).astype(np.intp)
+            np.clip(bins, 0, MEDIAN_HISTOGRAM_BINS - 1, out=bins)
+            bins += bin_offsets
+            histograms += np.bincount(bins.ravel(), minlength=histograms.size)
+
+        stds = np.sqrt(m2 / (count - 1))
+        medians = self._histogram_medians(
+            histograms.reshape(num_policies, MEDIAN_HISTOGRAM_BINS), lows, bin_widths
+        )
+
+        return total_costs, revenues, (means, stds, medians)
+
+    @staticmethod
+    def _histogram_medians(
+        histograms: np.ndarray,
+        lows: np.ndarray,
+        bin_widths: np.ndarray
+    ) -> np.ndarray:
+        """
+        Estimate each row's median from its fixed-width histogram
+
+        Args:
+            histograms: Array of shape (K, bins) with sample counts per bin
+            lows: Lower edge of the first bin for each row
+            bin_widths: Bin width for each row
+
+        Returns:
+            Array of K medians, linearly interpolated within the median bin
+        """
+        cumulative = histograms.cumsum(axis=1)
+        half = cumulative[:, -1] / 2
+        rows = np.arange(len(histograms))
+        median_bins = (cumulative < half[:, None]).sum(axis=1)
+        below = np.where(median_bins > 0, cumulative[rows, median_bins - 1], 0)
+        fraction = (half - below) / histograms[rows, median_bins]
+
+        return lows + (median_bins + fraction) * bin_widths
+
+    @staticmethod
+    def _policy_moments(policy_costs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-policy statistics in one vectorized pass over the (N, K) array
+
+        Returns:
+            Tuple of (policy_means, policy_stds, policy_medians)
+        """
+        return (
+            policy_costs.mean(axis=0, dtype=np.float64),
+            policy_costs.std(axis=0, ddof=1, dtype=np.float64),
+            np.median(policy_costs, axis=0)
+        )
+
     def _calculate_statistics(
         self,
-        policy_costs: pd.DataFrame,
-        total_costs: np.ndarray,
+        policy_moments: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        sorted_total_costs: np.ndarray,
         revenues: np.ndarray,
-        net_budget_impact: np.ndarray,
-        threshold_exceedances: int
+        net_budget_impact: np.ndarray
     ) -> Dict:
         """
         Calculate comprehensive statistics from simulation results
 
+        The min, max, percentiles and threshold exceedance count of the total
+        costs are all read off the sorted array.
+
         Returns:
             Dictionary of statistics
         """
+        policy_means, policy_stds, policy_medians = policy_moments
+
+        threshold_exceedances = len(sorted_total_costs) - np.searchsorted(
+            sorted_total_costs, self.budget_threshold, side="right"
+        )
+
         stats_dict = {
             "num_simulations": self.num_simulations,
             "budget_threshold": self.budget_threshold,
 
-            # Total costs
-            "total_costs": {
-                "mean": float(np.mean(total_costs)),
-                "median": float(np.median(total_costs)),
-                "std": float(np.std(total_costs)),
-                "min": float(np.min(total_costs)),
-                "max": float(np.max(total_costs)),
-                "percentiles": {
-                    p: float(np.percentile(total_costs, p))
-                    for p in PERCENTILES
-                }
-            },
-
-            # Revenues
-            "revenues": {
-                "mean": float(np.mean(revenues)),
-                "median": float(np.median(revenues)),
-                "std": float(np.std(revenues)),
-                "min": float(np.min(revenues)),
-                "max": float(np.max(revenues))
-            },
-
-            # Net budget impact
-            "net_budget_impact": {
-                "mean": float(np.mean(net_budget_impact)),
-                "median": float(np.median(net_budget_impact)),
-                "std": float(np.std(net_budget_impact)),
-                "min": float(np.min(net_budget_impact)),
-                "max": float(np.max(net_budget_impact)),
-                "percentiles": {
-                    p: float(np.percentile(net_budget_impact, p))
-                    for p in PERCENTILES
-                }
-            },
+            # Total costs, revenues and net budget impact
+            "total_costs": self._summarize(sorted_total_costs, presorted=True),
+            "revenues": self._summarize(revenues, with_percentiles=False),
+            "net_budget_impact": self._summarize(net_budget_impact),
 
             # Threshold analysis
             "threshold_analysis": {
@@ -177,22 +384,63 @@ class MonteCarloSimulator:
 
             # Confidence intervals
             "confidence_intervals": self._calculate_confidence_intervals(
-                total_costs, revenues, net_budget_impact
+                sorted_total_costs, revenues, net_budget_impact
             ),
 
             # Individual policy statistics
             "policy_statistics": {
                 policy_key: {
-                    "mean": float(policy_costs[policy_key].mean()),
-                    "std": float(policy_costs[policy_key].std()),
-                    "median": float(policy_costs[policy_key].median())
+                    "mean": float(mean),
+                    "std": float(std),
+                    "median": float(median)
                 }
-                for policy_key in policy_costs.columns
+                for policy_key, mean, std, median in zip(
+                    POLICY_KEYS, policy_means, policy_stds, policy_medians
+                )
             }
         }
 
         return stats_dict
 
+    @staticmethod
+    def _summarize(
+        data: np.ndarray,
+        with_percentiles: bool = True,
+        presorted: bool = False
+    ) -> Dict:
+        """
+        Summarize one result array
+
+        Min, the configured percentiles (median included) and max all come
+        from a single np.percentile call, so the data is partitioned once,
+        or from direct lookups when the data is already sorted.
+
+        Args:
+            data: Array of simulated values
+            with_percentiles: Include the PERCENTILES breakdown in the summary
+            presorted: Data is sorted ascending, so quantiles are read by index
+
+        Returns:
+            Dictionary with mean, median, std, min, max and optionally percentiles
+        """
+        if presorted:
+            quantiles = sorted_percentiles(data, _SUMMARY_QUANTILES)
+        else:
+            quantiles = np.percentile(data, _SUMMARY_QUANTILES)
+        percentiles = dict(zip(_PERCENTILE_KEYS, quantiles[1:-1].tolist()))
+
+        summary = {
+            "mean": float(data.mean(dtype=np.float64)),
+            "median": percentiles[50],
+            "std": float(data.std(dtype=np.float64)),
+            "min": float(quantiles[0]),
+            "max": float(quantiles[-1])
+        }
+        if with_percentiles:
+            summary["percentiles"] = percentiles
+
+        return summary
+
     def _calculate_confidence_intervals(
         self,
         total_costs: np.ndarray,
@@ -205,13 +453,17 @@ class MonteCarloSimulator:
         Returns:
             Dictionary of confidence intervals
         """
-        alpha = 1 - CONFIDENCE_LEVEL
-
         def ci(data):
-            mean = np.mean(data)
-            sem = stats.sem(data)
-            interval = stats.t.interval(CONFIDENCE_LEVEL, len(data) - 1, loc=mean, scale=sem)
-            return {"lower": float(interval[0]), "upper": float(interval[1])}
+            mean = data.mean(dtype=np.float64)
+            sem = data.std(ddof=1, dtype=np.float64) / np.sqrt(len(data))
+            if len(data) < T_INTERVAL_MAX_SAMPLES:
+                # Rare small-sample case; scipy is slow to import, so load it here
+                from scipy import stats
+                critical = stats.t.ppf(1 - (1 - CONFIDENCE_LEVEL) / 2, len(data) - 1)
+            else:
+                # The t distribution is indistinguishable from the normal here
+                critical = _Z_CRITICAL
+            return {"lower": float(mean - critical * sem), "upper": float(mean + critical * sem)}
 
         return {
             "total_costs": ci(total_costs),
@@ -227,56 +479,59 @@ class MonteCarloSimulator:
             results: SimulationResults object
         """
         stats = results.statistics
+        out = []
 
-        print("\n" + "=" * 70)
-        print("MONTE CARLO SIMULATION RESULTS SUMMARY")
-        print("=" * 70)
+        out.append("\n" + "=" * 70)
+        out.append("MONTE CARLO SIMULATION RESULTS SUMMARY")
+        out.append("=" * 70)
 
-        print(f"\nSimulations run: {stats['num_simulations']:,}")
-        print(f"Budget threshold: ${stats['budget_threshold']:.1f}B")
+        out.append(f"\nSimulations run: {stats['num_simulations']:,}")
+        out.append(f"Budget threshold: ${stats['budget_threshold']:.1f}B")
 
-        print("\n--- TOTAL POLICY COSTS ---")
-        print(f"Mean:   ${stats['total_costs']['mean']:.2f}B")
-        print(f"Median: ${stats['total_costs']['median']:.2f}B")
-        print(f"Std:    ${stats['total_costs']['std']:.2f}B")
-        print(f"Range:  ${stats['total_costs']['min']:.2f}B - ${stats['total_costs']['max']:.2f}B")
+        out.append("\n--- TOTAL POLICY COSTS ---")
+        out.append(f"Mean:   ${stats['total_costs']['mean']:.2f}B")
+        out.append(f"Median: ${stats['total_costs']['median']:.2f}B")
+        out.append(f"Std:    ${stats['total_costs']['std']:.2f}B")
+        out.append(f"Range:  ${stats['total_costs']['min']:.2f}B - ${stats['total_costs']['max']:.2f}B")
 
-        print("\nPercentiles:")
+        out.append("\nPercentiles:")
         for p, value in stats['total_costs']['percentiles'].items():
-            print(f"  {p}th: ${value:.2f}B")
+            out.append(f"  {p}th: ${value:.2f}B")
 
-        print("\n--- REVENUE PROJECTIONS ---")
-        print(f"Mean:   ${stats['revenues']['mean']:.2f}B")
-        print(f"Median: ${stats['revenues']['median']:.2f}B")
-        print(f"Std:    ${stats['revenues']['std']:.2f}B")
+        out.append("\n--- REVENUE PROJECTIONS ---")
+        out.append(f"Mean:   ${stats['revenues']['mean']:.2f}B")
+        out.append(f"Median: ${stats['revenues']['median']:.2f}B")
+        out.append(f"Std:    ${stats['revenues']['std']:.2f}B")
 
-        print("\n--- NET BUDGET IMPACT (Cost - Revenue) ---")
-        print(f"Mean:   ${stats['net_budget_impact']['mean']:.2f}B")
-        print(f"Median: ${stats['net_budget_impact']['median']:.2f}B")
-        print(f"Std:    ${stats['net_budget_impact']['std']:.2f}B")
+        out.append("\n--- NET BUDGET IMPACT (Cost - Revenue) ---")
+        out.append(f"Mean:   ${stats['net_budget_impact']['mean']:.2f}B")
+        out.append(f"Median: ${stats['net_budget_impact']['median']:.2f}B")
+        out.append(f"Std:    ${stats['net_budget_impact']['std']:.2f}B")
 
         if stats['net_budget_impact']['mean'] > 0:
-            print(f"\n⚠️  Average deficit: ${stats['net_budget_impact']['mean']:.2f}B")
+            out.append(f"\n⚠️  Average deficit: ${stats['net_budget_impact']['mean']:.2f}B")
         else:
-            print(f"\n✓ Average surplus: ${-stats['net_budget_impact']['mean']:.2f}B")
+            out.append(f"\n✓ Average surplus: ${-stats['net_budget_impact']['mean']:.2f}B")
 
-        print("\n--- THRESHOLD ANALYSIS ---")
-        print(f"Times exceeded ${stats['budget_threshold']:.1f}B: {stats['threshold_analysis']['exceedances']:,}")
-        print(f"Probability: {stats['threshold_analysis']['probability']:.4f}")
-        print(f"Percentage: {stats['threshold_analysis']['percentage']:.2f}%")
+        out.append("\n--- THRESHOLD ANALYSIS ---")
+        out.append(f"Times exceeded ${stats['budget_threshold']:.1f}B: {stats['threshold_analysis']['exceedances']:,}")
+        out.append(f"Probability: {stats['threshold_analysis']['probability']:.4f}")
+        out.append(f"Percentage: {stats['threshold_analysis']['percentage']:.2f}%")
 
-        print("\n--- CONFIDENCE INTERVALS (95%) ---")
+        out.append("\n--- CONFIDENCE INTERVALS (95%) ---")
         ci = stats['confidence_intervals']
-        print(f"Total Costs: ${ci['total_costs']['lower']:.2f}B - ${ci['total_costs']['upper']:.2f}B")
-        print(f"Net Impact:  ${ci['net_budget_impact']['lower']:.2f}B - ${ci['net_budget_impact']['upper']:.2f}B")
+        out.append(f"Total Costs: ${ci['total_costs']['lower']:.2f}B - ${ci['total_costs']['upper']:.2f}B")
+        out.append(f"Net Impact:  ${ci['net_budget_impact']['lower']:.2f}B - ${ci['net_budget_impact']['upper']:.2f}B")
 
-        print("\n--- INDIVIDUAL POLICY COSTS ---")
+        out.append("\n--- INDIVIDUAL POLICY COSTS ---")
         for policy_key, policy_stats in stats['policy_statistics'].items():
             policy_name = POLICY_PARAMETERS[policy_key].name
-            print(f"{policy_name}:")
-            print(f"  Mean: ${policy_stats['mean']:.2f}B, Std: ${policy_stats['std']:.2f}B")
+            out.append(f"{policy_name}:")
+            out.append(f"  Mean: ${policy_stats['mean']:.2f}B, Std: ${policy_stats['std']:.2f}B")
+
+        out.append("\n" + "=" * 70)
 
-        print("\n" + "=" * 70)
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def run_sensitivity_analysis(
@@ -286,6 +541,10 @@ def run_sensitivity_analysis(
     """
     Perform sensitivity analysis to identify which policies drive the most variance
 
+    Policies are independent, so the total cost variance is the sum of the
+    per-policy variances, each known in closed form from the parameters; no
+    pass over the samples is needed.
+
     Args:
         base_simulator: The base simulator configuration
         results: Base simulation results
@@ -296,11 +555,10 @@ def run_sensitivity_analysis(
     print("\nPerforming sensitivity analysis...")
 
     sensitivity = {}
-    base_variance = np.var(results.total_costs)
+    base_variance = POLICY_VARIANCES.sum()
 
     # For each policy, calculate how much it contributes to total variance
-    for policy_key in results.policy_costs.columns:
-        policy_variance = np.var(results.policy_costs[policy_key])
+    for policy_key, policy_variance in zip(POLICY_KEYS, POLICY_VARIANCES):
         contribution = policy_variance / base_variance
         sensitivity[policy_key] = {
             "variance": float(policy_variance),
@@ -313,9 +571,100 @@ def run_sensitivity_analysis(
         sorted(sensitivity.items(), key=lambda x: x[1]['contribution_to_total'], reverse=True)
     )
 
-    print("\nVariance contribution by policy:")
+    out = ["\nVariance contribution by policy:"]
     for policy_key, sens in sensitivity.items():
         policy_name = POLICY_PARAMETERS[policy_key].name
-        print(f"  {policy_name}: {sens['percentage']:.1f}%")
+        out.append(f"  {policy_name}: {sens['percentage']:.1f}%")
+    sys.stdout.write("\n".join(out) + "\n")
 
     return sensitivity
+
+
+def sorted_percentiles(sorted_data: np.ndarray, percentiles) -> np.ndarray:
+    """
+    Percentiles of an ascending array by direct lookup
+
+    Uses the same linear interpolation as np.percentile's default method,
+    without re-partitioning the data.
+
+    Args:
+        sorted_data: Array sorted in ascending order
+        percentiles: Percentiles to compute, in [0, 100]
+
+    Returns:
+        Array of percentile values (float64)
+    """
+    positions = np.asarray(percentiles, dtype=np.float64) / 100 * (len(sorted_data) - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, len(sorted_data) - 1)
+    fraction = positions - lower
+
+    lower_values = sorted_data[lower].astype(np.float64)
+    return lower_values + (sorted_data[upper] - lower_values) * fraction
+
+
+def _sample_shard(args: Tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample one shard of policy costs and revenues in a worker process
+
+    Args:
+        args: Tuple of (seed, size, means, stds, rev_mean, rev_std, dtype)
+
+    Returns:
+        Tuple of (policy_costs, revenues) for the shard
+    """
+    seed, size, means, stds, rev_mean, rev_std, dtype = args
+    return sample_costs(np.random.default_rng(seed), means, stds, rev_mean, rev_std, size, dtype)
+
+
+def sample_costs_parallel(
+    means: np.ndarray,
+    stds: np.ndarray,
+    rev_mean: float,
+    rev_std: float,
+    num_simulations: int,
+    random_seed: Optional[int] = None,
+    processes: Optional[int] = None,
+    dtype: type = np.float64
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample policy costs and revenues across CPU cores
+
+    Simulations are split into one shard per process, each seeded from an
+    independent SeedSequence child so results are reproducible for a given seed.
+    Starting the spawn-context pool costs ~1.3 s while serial sampling runs at
+    ~90 ms per million simulations, so this only pays off at tens of millions
+    of runs.
+
+    Args:
+        means: Mean cost of each policy in billions
+        stds: Standard deviation of each policy in billions
+        rev_mean: Mean revenue in billions
+        rev_std: Revenue standard deviation in billions
+        num_simulations: Number of simulation runs
+        random_seed: Random seed for reproducibility
+        processes: Number of worker processes (default: CPU count)
+        dtype: Floating point type of the returned arrays (float32 or float64)
+
+    Returns:
+        Tuple of (policy_costs, revenues) with shapes (N, K) and (N,)
+    """
+    processes = processes or cpu_count()
+    base_size, remainder = divmod(num_simulations, processes)
+    shard_sizes = [base_size + (shard < remainder) for shard in range(processes)]
+    seeds = np.random.SeedSequence(random_seed).spawn(processes)
+
+    shard_args = [
+        (seed, size, means, stds, rev_mean, rev_std, dtype)
+        for seed, size in zip(seeds, shard_sizes)
+    ]
+
+    # Spawn rather than fork: forking after Numba or BLAS threads have started
+    # can leave the children deadlocked on locks held by those threads
+    with get_context("spawn").Pool(processes) as pool:
+        shards = pool.map(_sample_shard, shard_args)
+
+    policy_costs = np.concatenate([shard[0] for shard in shards])
+    revenues = np.concatenate([shard[1] for shard in shards])
+
+    return policy_costs, revenues
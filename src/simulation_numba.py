@@ -0,0 +1,156 @@
+"""
+Optional Numba kernels for the Monte Carlo hot loop
+
+Numba is not a hard dependency: when it is not installed NUMBA_AVAILABLE is
+False and callers fall back to the vectorized NumPy path.
+"""
+
+import numpy as np
+
+try:
+    from numba import get_thread_id, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Simulations handled per parallel work item in simulation_kernel
+KERNEL_CHUNK_SIZE = 65536
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(inline='always')
+    def _truncated_normal(mean, std):
+        """Draw from a normal truncated at zero by redrawing negatives"""
+        value = mean + std * np.random.randn()
+        while value < 0.0:
+            value = mean + std * np.random.randn()
+        return value
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def simulation_kernel(means, stds, rev_mean, rev_std, threshold, num_sims, seed,
+                          dtype, with_net_impact):
+        """
+        Sample policy costs and revenues and reduce them in one fused parallel pass
+
+        Simulations are processed in chunks of KERNEL_CHUNK_SIZE; each chunk
+        reseeds its thread's generator with seed + chunk index, so results are
+        reproducible regardless of how chunks are scheduled across threads.
+
+        Args:
+            means: Mean cost of each policy in billions
+            stds: Standard deviation of each policy in billions
+            rev_mean: Mean revenue in billions
+            rev_std: Revenue standard deviation in billions
+            threshold: Budget threshold in billions
+            num_sims: Number of simulation runs
+            seed: Base random seed
+            dtype: Floating point type of the output arrays (np.float32 or np.float64)
+            with_net_impact: Also fill the net budget impact array
+
+        Returns:
+            Tuple of (policy_costs, total_costs, revenues, net_budget_impact,
+            threshold_exceedances); negative draws are redrawn, so costs and
+            revenues follow normals truncated at zero, and net_budget_impact
+            is empty unless with_net_impact is set
+        """
+        num_policies = means.shape[0]
+        num_chunks = (num_sims + KERNEL_CHUNK_SIZE - 1) // KERNEL_CHUNK_SIZE
+        policy_costs = np.empty((num_sims, num_policies), dtype=dtype)
+        total_costs = np.empty(num_sims, dtype=dtype)
+        revenues = np.empty(num_sims, dtype=dtype)
+        net_budget_impact = np.empty(num_sims if with_net_impact else 0, dtype=dtype)
+        chunk_exceedances = np.zeros(num_chunks, dtype=np.int64)
+
+        for chunk in prange(num_chunks):
+            np.random.seed(seed + chunk)
+            start = chunk * KERNEL_CHUNK_SIZE
+            stop = min(start + KERNEL_CHUNK_SIZE, num_sims)
+            exceedances = 0
+
+            for i in range(start, stop):
+                total = 0.0
+                for k in range(num_policies):
+                    cost = _truncated_normal(means[k], stds[k])
+                    policy_costs[i, k] = cost
+                    total += cost
+
+                revenue = _truncated_normal(rev_mean, rev_std)
+
+                total_costs[i] = total
+                revenues[i] = revenue
+                if with_net_impact:
+                    net_budget_impact[i] = total - revenue
+                if total > threshold:
+                    exceedances += 1
+
+            chunk_exceedances[chunk] = exceedances
+
+        return policy_costs, total_costs, revenues, net_budget_impact, chunk_exceedances.sum()
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def streaming_kernel(means, stds, rev_mean, rev_std, num_sims, seed, dtype,
+                         lows, bin_widths, num_bins, num_threads):
+        """
+        simulation_kernel's keep_samples=False mode: accumulate per-policy statistics
+
+        Draws exactly the same samples as simulation_kernel for a given seed,
+        but never allocates the (num_sims, K) policy cost matrix. Each chunk
+        keeps a running mean and sum of squared deviations per policy
+        (Welford's update), and each thread fills its own fixed-bin histograms
+        for the median estimates.
+
+        Args:
+            means: Mean cost of each policy in billions
+            stds: Standard deviation of each policy in billions
+            rev_mean: Mean revenue in billions
+            rev_std: Revenue standard deviation in billions
+            num_sims: Number of simulation runs
+            seed: Base random seed
+            dtype: Floating point type of the output arrays (np.float32 or np.float64)
+            lows: Lower edge of the first histogram bin for each policy
+            bin_widths: Histogram bin width for each policy
+            num_bins: Number of histogram bins per policy
+            num_threads: numba.get_num_threads() of the caller, one histogram
+                set per thread (read outside so the kernel stays cacheable)
+
+        Returns:
+            Tuple of (total_costs, revenues, chunk_counts, chunk_means, chunk_m2,
+            histograms); the chunk arrays have one row per chunk and histograms
+            has shape (threads, K, num_bins), both to be merged by the caller
+        """
+        num_policies = means.shape[0]
+        num_chunks = (num_sims + KERNEL_CHUNK_SIZE - 1) // KERNEL_CHUNK_SIZE
+        total_costs = np.empty(num_sims, dtype=dtype)
+        revenues = np.empty(num_sims, dtype=dtype)
+        chunk_counts = np.zeros(num_chunks, dtype=np.int64)
+        chunk_means = np.zeros((num_chunks, num_policies))
+        chunk_m2 = np.zeros((num_chunks, num_policies))
+        histograms = np.zeros((num_threads, num_policies, num_bins), dtype=np.int64)
+
+        for chunk in prange(num_chunks):
+            np.random.seed(seed + chunk)
+            start = chunk * KERNEL_CHUNK_SIZE
+            stop = min(start + KERNEL_CHUNK_SIZE, num_sims)
+            histogram = histograms[get_thread_id()]
+
+            for i in range(start, stop):
+                n = i - start + 1
+                total = 0.0
+                for k in range(num_policies):
+                    cost = _truncated_normal(means[k], stds[k])
+                    total += cost
+
+                    delta = cost - chunk_means[chunk, k]
+                    chunk_means[chunk, k] += delta / n
+                    chunk_m2[chunk, k] += delta * (cost - chunk_means[chunk, k])
+
+                    b = int((cost - lows[k]) / bin_widths[k])
+                    histogram[k, min(max(b, 0), num_bins - 1)] += 1
+
+                total_costs[i] = total
+                revenues[i] = _truncated_normal(rev_mean, rev_std)
+
+            chunk_counts[chunk] = stop - start
+
+        return total_costs, revenues, chunk_counts, chunk_means, chunk_m2, histograms
@@ -3,8 +3,12 @@ Visualization module for Monte Carlo simulation results
 """
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from multiprocessing import cpu_count, get_context
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
 import plotly.graph_objects as go
 import plotly.express as px
@@ -12,50 +16,268 @@ from plotly.subplots import make_subplots
 from pathlib import Path
 from typing import Optional
 
-from .simulation import SimulationResults
+from .simulation import SimulationResults, sorted_percentiles
 from .parameters import POLICY_PARAMETERS
 from .config import (
     RESULTS_DIR,
-    FIGURE_DPI,
+    FAST_DPI,
+    SAVE_FORMAT,
     COLOR_PALETTE,
     PLOT_STYLE,
-    FIGURE_SIZE
+    FIGURE_SIZE,
+    CDF_MAX_POINTS
 )
 
 
+def _fast_kde_1d(data: np.ndarray, grid_n: int = 512):
+    """
+    Gaussian KDE on a regular grid via binning and FFT convolution
+
+    The data is binned once and the histogram is convolved with a Gaussian
+    kernel in frequency space, so the cost is O(N + B log B) instead of
+    gaussian_kde's O(N * B) evaluation.
+
+    Args:
+        data: 1-D array of samples
+        grid_n: Number of grid points (histogram bins)
+
+    Returns:
+        Tuple of (grid, density) arrays of length grid_n
+    """
+    n = data.size
+    std = float(data.std(dtype=np.float64))
+    # Silverman's rule of thumb; fall back to a tiny width for constant data
+    bandwidth = 1.06 * std * n ** (-1 / 5) or 1e-6
+
+    low = float(data.min()) - 3 * bandwidth
+    high = float(data.max()) + 3 * bandwidth
+    counts, edges = np.histogram(data, bins=grid_n, range=(low, high))
+    dx = edges[1] - edges[0]
+
+    # Kernel centred on index 0 of a 2 * grid_n buffer; the zero padding makes
+    # the circular FFT convolution equal to the linear one
+    offsets = np.arange(2 * grid_n)
+    offsets = np.where(offsets < grid_n, offsets, offsets - 2 * grid_n) * dx
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= kernel.sum() * dx
+
+    density = np.fft.irfft(
+        np.fft.rfft(counts, 2 * grid_n) * np.fft.rfft(kernel), 2 * grid_n
+    )[:grid_n] / n
+
+    return (edges[:-1] + edges[1:]) / 2, density
+
+
+def _hist(data: np.ndarray, bins: int = 50, density: bool = False):
+    """
+    Bin data once with np.histogram for drawing as bars
+
+    Args:
+        data: 1-D array of samples
+        bins: Number of equal-width bins
+        density: Normalize counts to a probability density
+
+    Returns:
+        Tuple of (edges, counts) with len(edges) == len(counts) + 1
+    """
+    counts, edges = np.histogram(data, bins=bins, density=density)
+    return edges, counts
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int = CDF_MAX_POINTS):
+    """
+    Downsample a line with Largest-Triangle-Three-Buckets
+
+    The first and last points are kept; the points in between are split into
+    n_out - 2 buckets and each bucket keeps the point forming the largest
+    triangle with the previously kept point and the next bucket's average,
+    which preserves the visual shape of the line.
+
+    Args:
+        x: Sorted x values
+        y: y values matching x
+        n_out: Number of points to keep
+
+    Returns:
+        Tuple of (x, y) with at most n_out points; the inputs when already small
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+
+    prev = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_start = stop
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+
+        # Twice the triangle area; the constant factor does not change the argmax
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[start:stop] - y[prev])
+            - (x[prev] - x[start:stop]) * (avg_y - y[prev])
+        )
+        prev = start + int(areas.argmax())
+        selected[bucket + 1] = prev
+
+    return x[selected], y[selected]
+
+
+def _new_figure(figsize, layout: str = 'constrained') -> Figure:
+    """
+    Create a figure drawn directly on an Agg canvas
+
+    Bypasses pyplot, so no global figure manager is created or torn down
+    per plot and rendering stays headless in worker processes.
+
+    Args:
+        figsize: Figure size in inches
+        layout: Layout engine, 'constrained' or 'tight'
+
+    Returns:
+        Figure attached to a FigureCanvasAgg
+    """
+    fig = Figure(figsize=figsize, layout=layout)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _set_style():
+    """
+    Apply the seaborn style, palette and Agg path settings used by every plot
+    """
+    sns.set_style(PLOT_STYLE)
+    sns.set_palette(COLOR_PALETTE)
+
+    # Merge line segments that deviate by less than a pixel and hand Agg long
+    # paths in chunks, so the CDF and KDE lines render with fewer vertices
+    matplotlib.rcParams.update({
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000
+    })
+
+
+def _render_plot(visualizer: 'SimulationVisualizer', method_name: str):
+    """
+    Run one plot method of a visualizer in a worker process
+
+    Unpickling does not call __init__, so the style is applied here.
+
+    Args:
+        visualizer: Pickled SimulationVisualizer
+        method_name: Name of the plot method to call
+    """
+    _set_style()
+    getattr(visualizer, method_name)()
+
+
 class SimulationVisualizer:
     """
     Create visualizations for Monte Carlo simulation results
     """
 
-    def __init__(self, results: SimulationResults, output_dir: str = RESULTS_DIR):
+    def __init__(
+        self,
+        results: SimulationResults,
+        output_dir: str = RESULTS_DIR,
+        dpi: int = FAST_DPI,
+        save_format: str = SAVE_FORMAT
+    ):
         """
         Initialize visualizer
 
         Args:
             results: SimulationResults object
             output_dir: Directory to save figures
+            dpi: Resolution of saved figures (FIGURE_DPI for publication quality)
+            save_format: 'png', or 'svg' to keep axes and text as vectors
         """
         self.results = results
+        self.dpi = dpi
+        self.save_format = save_format
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-        # Set style
-        sns.set_style(PLOT_STYLE)
-        sns.set_palette(COLOR_PALETTE)
+        _set_style()
+
+    @property
+    def sorted_total_costs(self) -> np.ndarray:
+        """
+        Read-only total costs sorted ascending, as sorted once by the simulator
+        """
+        return self.results.sorted_total_costs
+
+    @cached_property
+    def cdf_y(self) -> np.ndarray:
+        """
+        Empirical CDF ordinates matching sorted_total_costs (read-only)
+        """
+        n = len(self.sorted_total_costs)
+        cumulative_prob = np.arange(1, n + 1) / n
+        cumulative_prob.setflags(write=False)
+        return cumulative_prob
+
+    @cached_property
+    def total_cost_quantiles(self) -> dict:
+        """
+        Min, 5th, 25th, 50th, 75th, 95th percentiles and max of the total costs
+
+        Read once from sorted_total_costs and shared by the plots that need them.
+        """
+        percentiles = (0, 5, 25, 50, 75, 95, 100)
+        return dict(zip(percentiles, sorted_percentiles(self.sorted_total_costs, percentiles)))
 
-    def create_all_visualizations(self):
+    def _save_figure(self, fig: Figure, name: str):
+        """
+        Save a figure to the output directory in the configured format
+
+        Data layers marked rasterized (histogram bars, KDE, CDF, heatmap
+        cells) are embedded as images at self.dpi in SVG output, while axes
+        and text stay vector.
+
+        Args:
+            fig: Figure to save
+            name: File name without extension
+        """
+        fig.savefig(self.output_dir / f'{name}.{self.save_format}', dpi=self.dpi)
+
+    def create_all_visualizations(self, max_workers: int = 1):
         """
         Create all visualization plots
+
+        Plots are rendered serially by default. Each spawned worker re-imports
+        the plotting stack (~2 s) and receives a pickled copy of the results,
+        which outweighs a whole serial render unless the run is very large,
+        so parallel rendering is opt-in.
+
+        Args:
+            max_workers: Number of worker processes; 1 renders in this process
         """
         print("\nGenerating visualizations...")
 
-        self.plot_total_costs_distribution()
-        self.plot_individual_policy_distributions()
-        self.plot_net_budget_impact()
-        self.plot_threshold_analysis()
-        self.plot_correlation_heatmap()
-        self.create_interactive_dashboard()
+        plot_methods = [
+            'plot_total_costs_distribution',
+            'plot_individual_policy_distributions',
+            'plot_net_budget_impact',
+            'plot_threshold_analysis',
+            'plot_correlation_heatmap',
+            'create_interactive_dashboard'
+        ]
+        max_workers = min(max_workers, len(plot_methods), cpu_count())
+
+        if max_workers > 1:
+            # Spawn rather than fork, as in sample_costs_parallel
+            with ProcessPoolExecutor(max_workers, mp_context=get_context("spawn")) as executor:
+                list(executor.map(_render_plot, [self] * len(plot_methods), plot_methods))
+        else:
+            for method_name in plot_methods:
+                getattr(self, method_name)()
 
         print(f"\nAll visualizations saved to: {self.output_dir}")
 
@@ -63,30 +285,31 @@ class SimulationVisualizer:
         """
         Plot distribution of total policy costs
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=FIGURE_SIZE)
+        stats = self.results.statistics
+        threshold = stats['budget_threshold']
+        mean_cost = stats['total_costs']['mean']
+
+        fig = _new_figure(FIGURE_SIZE)
+        ax1, ax2 = fig.subplots(1, 2)
 
         # Histogram with KDE
-        ax1.hist(
-            self.results.total_costs,
-            bins=50,
-            density=True,
+        edges, counts = _hist(self.results.total_costs, bins=50, density=True)
+        ax1.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align='edge',
             alpha=0.7,
             color='steelblue',
-            edgecolor='black'
+            edgecolor='black',
+            rasterized=True
         )
 
         # Add KDE line
-        from scipy.stats import gaussian_kde
-        kde = gaussian_kde(self.results.total_costs)
-        x_range = np.linspace(
-            self.results.total_costs.min(),
-            self.results.total_costs.max(),
-            200
-        )
-        ax1.plot(x_range, kde(x_range), 'r-', linewidth=2, label='KDE')
+        grid, density = _fast_kde_1d(self.results.total_costs)
+        ax1.plot(grid, density, 'r-', linewidth=2, label='KDE', rasterized=True)
 
         # Add threshold line
-        threshold = self.results.statistics['budget_threshold']
         ax1.axvline(
             threshold,
             color='red',
@@ -96,7 +319,6 @@ class SimulationVisualizer:
         )
 
         # Add mean line
-        mean_cost = self.results.statistics['total_costs']['mean']
         ax1.axvline(
             mean_cost,
             color='green',
@@ -111,9 +333,19 @@ class SimulationVisualizer:
         ax1.legend()
         ax1.grid(True, alpha=0.3)
 
-        # Box plot
-        ax2.boxplot(
-            self.results.total_costs,
+        # Box plot from the shared quantiles, with whiskers at the 5th and 95th
+        # percentiles; individual fliers say little at this sample size
+        quantiles = self.total_cost_quantiles
+        box_stats = {
+            'med': quantiles[50],
+            'q1': quantiles[25],
+            'q3': quantiles[75],
+            'whislo': quantiles[5],
+            'whishi': quantiles[95],
+            'fliers': []
+        }
+        ax2.bxp(
+            [box_stats],
             vert=True,
             patch_artist=True,
             boxprops=dict(facecolor='lightblue', alpha=0.7),
@@ -132,17 +364,11 @@ class SimulationVisualizer:
         )
 
         ax2.set_ylabel('Total Policy Cost (Billions USD)', fontsize=12)
-        ax2.set_title('Total Costs: Box Plot', fontsize=14, fontweight='bold')
+        ax2.set_title('Total Costs: Box Plot (5th-95th pct. whiskers)', fontsize=14, fontweight='bold')
         ax2.legend()
         ax2.grid(True, alpha=0.3, axis='y')
 
-        plt.tight_layout()
-        plt.savefig(
-            self.output_dir / 'total_costs_distribution.png',
-            dpi=FIGURE_DPI,
-            bbox_inches='tight'
-        )
-        plt.close()
+        self._save_figure(fig, 'total_costs_distribution')
 
         print("  ✓ Total costs distribution plot saved")
 
@@ -150,24 +376,34 @@ class SimulationVisualizer:
         """
         Plot distributions for each individual policy
         """
-        n_policies = len(self.results.policy_costs.columns)
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        fig = _new_figure((14, 10))
+        axes = fig.subplots(2, 2)
         axes = axes.flatten()
 
-        for idx, (policy_key, policy_data) in enumerate(self.results.policy_costs.items()):
+        # One row per policy, each contiguous, so the mean and histogram passes
+        # stream through memory instead of striding across the columns
+        policy_rows = np.ascontiguousarray(self.results.policy_costs.T)
+        policy_means = policy_rows.mean(axis=1, dtype=np.float64)
+
+        for idx, policy_key in enumerate(self.results.policy_keys):
             ax = axes[idx]
+            policy_data = policy_rows[idx]
 
             # Histogram
-            ax.hist(
-                policy_data,
-                bins=30,
+            edges, counts = _hist(policy_data, bins=30)
+            ax.bar(
+                edges[:-1],
+                counts,
+                width=np.diff(edges),
+                align='edge',
                 alpha=0.7,
                 color=sns.color_palette()[idx],
-                edgecolor='black'
+                edgecolor='black',
+                rasterized=True
             )
 
             # Add mean line
-            mean_val = policy_data.mean()
+            mean_val = policy_means[idx]
             ax.axvline(
                 mean_val,
                 color='red',
@@ -183,19 +419,12 @@ class SimulationVisualizer:
             ax.legend()
             ax.grid(True, alpha=0.3)
 
-        plt.suptitle(
+        fig.suptitle(
             'Individual Policy Cost Distributions',
             fontsize=16,
-            fontweight='bold',
-            y=1.00
-        )
-        plt.tight_layout()
-        plt.savefig(
-            self.output_dir / 'individual_policy_distributions.png',
-            dpi=FIGURE_DPI,
-            bbox_inches='tight'
+            fontweight='bold'
         )
-        plt.close()
+        self._save_figure(fig, 'individual_policy_distributions')
 
         print("  ✓ Individual policy distributions plot saved")
 
@@ -203,22 +432,29 @@ class SimulationVisualizer:
         """
         Plot net budget impact (costs - revenues)
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=FIGURE_SIZE)
+        stats = self.results.statistics
+        mean_impact = stats['net_budget_impact']['mean']
+
+        fig = _new_figure(FIGURE_SIZE)
+        ax1, ax2 = fig.subplots(1, 2)
 
         # Distribution plot
-        ax1.hist(
-            self.results.net_budget_impact,
-            bins=50,
+        edges, counts = _hist(self.results.net_budget_impact, bins=50)
+        ax1.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align='edge',
             alpha=0.7,
             color='coral',
-            edgecolor='black'
+            edgecolor='black',
+            rasterized=True
         )
 
         # Add zero line
         ax1.axvline(0, color='green', linestyle='--', linewidth=2, label='Balanced Budget')
 
         # Add mean line
-        mean_impact = self.results.statistics['net_budget_impact']['mean']
         ax1.axvline(
             mean_impact,
             color='red',
@@ -235,14 +471,8 @@ class SimulationVisualizer:
 
         # Stacked comparison: costs vs revenues
         categories = ['Total Costs', 'Total Revenues']
-        means = [
-            self.results.statistics['total_costs']['mean'],
-            self.results.statistics['revenues']['mean']
-        ]
-        stds = [
-            self.results.statistics['total_costs']['std'],
-            self.results.statistics['revenues']['std']
-        ]
+        means = [stats['total_costs']['mean'], stats['revenues']['mean']]
+        stds = [stats['total_costs']['std'], stats['revenues']['std']]
 
         x_pos = np.arange(len(categories))
         colors = ['#e74c3c', '#27ae60']
@@ -268,13 +498,7 @@ class SimulationVisualizer:
                 fontweight='bold'
             )
 
-        plt.tight_layout()
-        plt.savefig(
-            self.output_dir / 'net_budget_impact.png',
-            dpi=FIGURE_DPI,
-            bbox_inches='tight'
-        )
-        plt.close()
+        self._save_figure(fig, 'net_budget_impact')
 
         print("  ✓ Net budget impact plot saved")
 
@@ -282,16 +506,20 @@ class SimulationVisualizer:
         """
         Plot threshold exceedance analysis
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=FIGURE_SIZE)
+        stats = self.results.statistics
+        threshold = stats['budget_threshold']
+        exceedances = stats['threshold_analysis']['exceedances']
+        below_threshold = stats['num_simulations'] - exceedances
+
+        fig = _new_figure(FIGURE_SIZE)
+        ax1, ax2 = fig.subplots(1, 2)
 
         # Cumulative distribution
-        sorted_costs = np.sort(self.results.total_costs)
-        cumulative_prob = np.arange(1, len(sorted_costs) + 1) / len(sorted_costs)
+        sorted_costs = self.sorted_total_costs
 
-        ax1.plot(sorted_costs, cumulative_prob, linewidth=2, color='steelblue')
+        ax1.plot(*_lttb(sorted_costs, self.cdf_y), linewidth=2, color='steelblue', rasterized=True)
 
         # Add threshold line
-        threshold = self.results.statistics['budget_threshold']
         ax1.axvline(
             threshold,
             color='red',
@@ -301,7 +529,7 @@ class SimulationVisualizer:
         )
 
         # Calculate and show probability at threshold
-        prob_at_threshold = np.sum(sorted_costs <= threshold) / len(sorted_costs)
+        prob_at_threshold = np.searchsorted(sorted_costs, threshold, side='right') / sorted_costs.size
         ax1.axhline(
             prob_at_threshold,
             color='red',
@@ -317,9 +545,6 @@ class SimulationVisualizer:
         ax1.grid(True, alpha=0.3)
 
         # Pie chart: above/below threshold
-        exceedances = self.results.statistics['threshold_analysis']['exceedances']
-        below_threshold = self.results.statistics['num_simulations'] - exceedances
-
         sizes = [below_threshold, exceedances]
         labels = [
             f'Below Threshold\n({below_threshold:,} runs)',
@@ -344,13 +569,7 @@ class SimulationVisualizer:
             fontweight='bold'
         )
 
-        plt.tight_layout()
-        plt.savefig(
-            self.output_dir / 'threshold_analysis.png',
-            dpi=FIGURE_DPI,
-            bbox_inches='tight'
-        )
-        plt.close()
+        self._save_figure(fig, 'threshold_analysis')
 
         print("  ✓ Threshold analysis plot saved")
 
@@ -358,20 +577,19 @@ class SimulationVisualizer:
         """
         Plot correlation heatmap between policies
         """
-        # Create correlation matrix
-        corr_matrix = self.results.policy_costs.corr()
+        # Correlation matrix straight from the (N, K) array; no DataFrame needed
+        corr_matrix = np.corrcoef(self.results.policy_costs, rowvar=False)
+        display_names = [POLICY_PARAMETERS[key].name for key in self.results.policy_keys]
 
-        # Rename columns for display
-        display_names = {
-            key: POLICY_PARAMETERS[key].name
-            for key in corr_matrix.columns
-        }
-        corr_matrix = corr_matrix.rename(columns=display_names, index=display_names)
-
-        fig, ax = plt.subplots(figsize=(10, 8))
+        # Constrained layout leaves no room for the tick labels of seaborn's
+        # colorbar beside a square heatmap, so this figure uses tight layout
+        fig = _new_figure((10, 8), layout='tight')
+        ax = fig.subplots()
 
         sns.heatmap(
             corr_matrix,
+            xticklabels=display_names,
+            yticklabels=display_names,
             annot=True,
             fmt='.3f',
             cmap='coolwarm',
@@ -381,6 +599,8 @@ class SimulationVisualizer:
             cbar_kws={'shrink': 0.8},
             ax=ax
         )
+        # Draw the cell mesh as one image rather than per-cell vector paths
+        ax.collections[0].set_rasterized(True)
 
         ax.set_title(
             'Policy Cost Correlation Matrix',
@@ -389,13 +609,7 @@ class SimulationVisualizer:
             pad=20
         )
 
-        plt.tight_layout()
-        plt.savefig(
-            self.output_dir / 'correlation_heatmap.png',
-            dpi=FIGURE_DPI,
-            bbox_inches='tight'
-        )
-        plt.close()
+        self._save_figure(fig, 'correlation_heatmap')
 
         print("  ✓ Correlation heatmap saved")
 
@@ -403,6 +617,8 @@ class SimulationVisualizer:
         """
         Create interactive Plotly dashboard
         """
+        threshold = self.results.statistics['budget_threshold']
+
         # Create subplots
         fig = make_subplots(
             rows=2,
@@ -414,17 +630,19 @@ class SimulationVisualizer:
                 'Cumulative Distribution'
             ),
             specs=[
-                [{"type": "histogram"}, {"type": "box"}],
-                [{"type": "histogram"}, {"type": "scatter"}]
+                [{"type": "xy"}, {"type": "box"}],
+                [{"type": "xy"}, {"type": "scatter"}]
             ]
         )
 
-        # 1. Total cost histogram
+        # 1. Total cost histogram, pre-binned so the HTML carries 50 bars, not N samples
+        edges, counts = _hist(self.results.total_costs, bins=50)
         fig.add_trace(
-            go.Histogram(
-                x=self.results.total_costs,
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
                 name='Total Costs',
-                nbinsx=50,
                 marker_color='steelblue',
                 opacity=0.7
             ),
@@ -433,7 +651,6 @@ class SimulationVisualizer:
         )
 
         # Add threshold line
-        threshold = self.results.statistics['budget_threshold']
         fig.add_vline(
             x=threshold,
             line_dash="dash",
@@ -443,25 +660,42 @@ class SimulationVisualizer:
             col=1
         )
 
-        # 2. Box plots for individual policies
-        for policy_key, policy_data in self.results.policy_costs.items():
+        # 2. Box plots for individual policies, drawn from precomputed quartiles
+        # and fences so the HTML carries seven numbers per box instead of N samples
+        policy_costs = self.results.policy_costs
+        q1, median, q3 = np.percentile(policy_costs, [25, 50, 75], axis=0)
+        iqr = q3 - q1
+        lower_fence = np.maximum(q1 - 1.5 * iqr, policy_costs.min(axis=0))
+        upper_fence = np.minimum(q3 + 1.5 * iqr, policy_costs.max(axis=0))
+        means = policy_costs.mean(axis=0, dtype=np.float64)
+        stds = policy_costs.std(axis=0, dtype=np.float64)
+
+        for idx, policy_key in enumerate(self.results.policy_keys):
             policy_name = POLICY_PARAMETERS[policy_key].name
             fig.add_trace(
                 go.Box(
-                    y=policy_data,
-                    name=policy_name,
-                    boxmean='sd'
+                    x=[policy_name],
+                    q1=[q1[idx]],
+                    median=[median[idx]],
+                    q3=[q3[idx]],
+                    lowerfence=[lower_fence[idx]],
+                    upperfence=[upper_fence[idx]],
+                    mean=[means[idx]],
+                    sd=[stds[idx]],
+                    name=policy_name
                 ),
                 row=1,
                 col=2
             )
 
         # 3. Net budget impact histogram
+        edges, counts = _hist(self.results.net_budget_impact, bins=50)
         fig.add_trace(
-            go.Histogram(
-                x=self.results.net_budget_impact,
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
                 name='Net Impact',
-                nbinsx=50,
                 marker_color='coral',
                 opacity=0.7
             ),
@@ -472,13 +706,13 @@ class SimulationVisualizer:
         # Add zero line
         fig.add_vline(x=0, line_dash="dash", line_color="green", row=2, col=1)
 
-        # 4. Cumulative distribution
-        sorted_costs = np.sort(self.results.total_costs)
-        cumulative_prob = np.arange(1, len(sorted_costs) + 1) / len(sorted_costs)
+        # 4. Cumulative distribution, downsampled: a monotone CDF looks the same
+        # with a couple of thousand points and the HTML stays small
+        cdf_costs, cumulative_prob = _lttb(self.sorted_total_costs, self.cdf_y)
 
         fig.add_trace(
-            go.Scatter(
-                x=sorted_costs,
+            go.Scattergl(
+                x=cdf_costs,
                 y=cumulative_prob,
                 mode='lines',
                 name='CDF',
@@ -518,8 +752,15 @@ class SimulationVisualizer:
         fig.update_xaxes(title_text="Total Cost (Billions USD)", row=2, col=2)
         fig.update_yaxes(title_text="Cumulative Probability", row=2, col=2)
 
-        # Save as HTML
-        fig.write_html(self.output_dir / 'interactive_dashboard.html')
+        # Save as HTML, loading plotly.js from the CDN instead of inlining the
+        # multi-megabyte bundle into every dashboard
+        fig.write_html(
+            self.output_dir / 'interactive_dashboard.html',
+            include_plotlyjs='cdn',
+            include_mathjax=False,
+            full_html=True,
+            config={'responsive': True}
+        )
 
         print("  ✓ Interactive dashboard saved (open interactive_dashboard.html in browser)")
 
@@ -530,7 +771,8 @@ class SimulationVisualizer:
         Args:
             sensitivity: Sensitivity analysis dictionary
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = _new_figure((10, 6))
+        ax = fig.subplots()
 
         policies = [POLICY_PARAMETERS[key].name for key in sensitivity.keys()]
         contributions = [sens['percentage'] for sens in sensitivity.values()]
@@ -554,12 +796,6 @@ class SimulationVisualizer:
                 fontweight='bold'
             )
 
-        plt.tight_layout()
-        plt.savefig(
-            self.output_dir / 'sensitivity_analysis.png',
-            dpi=FIGURE_DPI,
-            bbox_inches='tight'
-        )
-        plt.close()
+        self._save_figure(fig, 'sensitivity_analysis')
 
         print("  ✓ Sensitivity analysis plot saved")
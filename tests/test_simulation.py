@@ -9,12 +9,24 @@ from src.parameters import (
     PolicyParameter,
     POLICY_PARAMETERS,
     REVENUE_PARAMETERS,
+    POLICY_KEYS,
+    sample_all,
+    sample_costs,
     get_total_policy_costs,
+    get_policy_summary_arrays,
     validate_parameters
 )
-from src.simulation import MonteCarloSimulator
+from src.simulation import (
+    NUMBA_AVAILABLE,
+    MonteCarloSimulator,
+    run_sensitivity_analysis,
+    sample_costs_parallel
+)
 from src.config import DEFAULT_BUDGET_THRESHOLD
 
+# One generator shared by the sampling tests instead of reseeding per call
+_RNG = np.random.default_rng(42)
+
 
 class TestPolicyParameter(unittest.TestCase):
     """Test PolicyParameter class"""
@@ -43,12 +55,23 @@ class TestPolicyParameter(unittest.TestCase):
             source="Test"
         )
 
-        samples = param.sample(size=1000, seed=42)
+        samples = param.sample(size=1000, rng=_RNG)
 
         self.assertEqual(len(samples), 1000)
         self.assertTrue(np.all(samples >= 0))  # All samples should be non-negative
         self.assertAlmostEqual(np.mean(samples), 5.0, delta=0.2)
 
+    def test_truncated_sampling(self):
+        """Test that negative draws are truncated rather than clipped to zero"""
+        policy_costs, revenues = sample_costs(
+            _RNG, np.array([0.0]), np.array([1.0]), 0.0, 1.0, 20000
+        )
+
+        # A normal with mean 0 truncated at zero is half-normal: mean sqrt(2/pi)
+        for samples in (policy_costs[:, 0], revenues):
+            self.assertTrue(np.all(samples > 0))
+            self.assertAlmostEqual(samples.mean(), np.sqrt(2 / np.pi), delta=0.02)
+
     def test_parameter_validation(self):
         """Test parameter validation"""
         self.assertTrue(validate_parameters())
@@ -57,6 +80,16 @@ class TestPolicyParameter(unittest.TestCase):
 class TestMonteCarloSimulator(unittest.TestCase):
     """Test MonteCarloSimulator class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Run one simulation shared by the tests that only inspect results"""
+        cls.simulator = MonteCarloSimulator(
+            num_simulations=1000,
+            budget_threshold=2.0,
+            random_seed=42
+        )
+        cls.results = cls.simulator.run_simulation()
+
     def test_simulator_initialization(self):
         """Test simulator initialization"""
         simulator = MonteCarloSimulator(
@@ -69,55 +102,73 @@ class TestMonteCarloSimulator(unittest.TestCase):
         self.assertEqual(simulator.budget_threshold, 2.0)
         self.assertEqual(simulator.random_seed, 42)
 
-    def test_simulation_run(self):
-        """Test running simulation"""
-        simulator = MonteCarloSimulator(
-            num_simulations=100,
-            budget_threshold=2.0,
-            random_seed=42
+    def test_spawned_generators(self):
+        """Test that sub-simulation generators are reproducible and independent"""
+        first = MonteCarloSimulator(100, 2.0, 42)
+        second = MonteCarloSimulator(100, 2.0, 42)
+
+        draws = [first.spawn_rng().standard_normal(10) for _ in range(2)]
+        draws_again = [second.spawn_rng().standard_normal(10) for _ in range(2)]
+
+        np.testing.assert_array_equal(draws, draws_again)
+        self.assertFalse(np.array_equal(draws[0], draws[1]))
+
+        # Spawning leaves the main generator's stream untouched
+        np.testing.assert_array_equal(
+            first.rng.standard_normal(10), np.random.default_rng(42).standard_normal(10)
         )
 
-        results = simulator.run_simulation()
+    def test_simulation_run(self):
+        """Test running simulation"""
+        results = self.results
 
         # Check results structure
-        self.assertEqual(len(results.total_costs), 100)
-        self.assertEqual(len(results.revenues), 100)
-        self.assertEqual(len(results.net_budget_impact), 100)
+        self.assertEqual(len(results.total_costs), 1000)
+        self.assertEqual(len(results.revenues), 1000)
+        self.assertEqual(len(results.net_budget_impact), 1000)
 
         # Check all costs are non-negative
         self.assertTrue(np.all(results.total_costs >= 0))
         self.assertTrue(np.all(results.revenues >= 0))
 
+        # Samples are stored in float32
+        self.assertEqual(results.total_costs.dtype, np.float32)
+
         # Check statistics are present
         self.assertIn('total_costs', results.statistics)
         self.assertIn('revenues', results.statistics)
         self.assertIn('net_budget_impact', results.statistics)
         self.assertIn('threshold_analysis', results.statistics)
 
+    def test_float64_accumulation(self):
+        """Test that float32 samples are summarized with float64 accumulators"""
+        results = MonteCarloSimulator(1_000_000, 2.0, 42).run_simulation()
+        reference = results.policy_costs.astype(np.float64).sum(axis=1)
+        stats = results.statistics['total_costs']
+
+        # Accumulating the million float32 totals in float32 is off by ~4e-7
+        self.assertLess(abs(stats['mean'] - reference.mean()), 1e-8)
+        self.assertLess(abs(stats['std'] - reference.std()), 1e-8)
+
     def test_threshold_analysis(self):
         """Test threshold exceedance calculation"""
-        simulator = MonteCarloSimulator(
-            num_simulations=1000,
-            budget_threshold=2.0,
-            random_seed=42
-        )
-
-        results = simulator.run_simulation()
+        results = self.results
 
         # Most simulations should exceed $2B threshold
         # (since mean total cost is ~$16.8B)
         exceedance_rate = results.statistics['threshold_analysis']['probability']
         self.assertGreater(exceedance_rate, 0.95)  # Should be > 95%
 
+        # The sorted totals are kept read-only on the results for the plots
+        np.testing.assert_array_equal(results.sorted_total_costs, np.sort(results.total_costs))
+        self.assertFalse(results.sorted_total_costs.flags.writeable)
+
+        # Counted from the sorted totals, so it must match a direct comparison
+        self.assertEqual(results.threshold_exceedances, np.sum(results.total_costs > 2.0))
+
     def test_statistics_calculation(self):
         """Test statistics calculation"""
-        simulator = MonteCarloSimulator(
-            num_simulations=1000,
-            budget_threshold=2.0,
-            random_seed=42
-        )
-
-        results = simulator.run_simulation()
+        results = self.results
         stats = results.statistics
 
         # Check mean is reasonable
@@ -132,6 +183,88 @@ class TestMonteCarloSimulator(unittest.TestCase):
             self.assertGreater(percentiles[p], prev_val)
             prev_val = percentiles[p]
 
+        # Percentiles read from the sorted totals match np.percentile
+        np.testing.assert_allclose(
+            list(percentiles.values()),
+            np.percentile(results.total_costs.astype(np.float64), list(percentiles))
+        )
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba is not installed")
+    def test_numba_simulation(self):
+        """Test the Numba kernel path is reproducible and matches expected costs"""
+        results = MonteCarloSimulator(1000, 2.0, 42, use_numba=True).run_simulation()
+        results_again = MonteCarloSimulator(1000, 2.0, 42, use_numba=True).run_simulation()
+
+        np.testing.assert_array_equal(results.total_costs, results_again.total_costs)
+        self.assertEqual(results.policy_costs.shape, (1000, len(POLICY_PARAMETERS)))
+        self.assertTrue(np.all(results.policy_costs >= 0))
+
+        expected_mean, _ = get_total_policy_costs()
+        self.assertAlmostEqual(results.statistics['total_costs']['mean'], expected_mean, delta=1.0)
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba is not installed")
+    def test_numba_streaming_statistics(self):
+        """Test that the Numba kernel without kept samples matches the kept-sample run"""
+        kept = MonteCarloSimulator(5000, 2.0, 42, use_numba=True).run_simulation()
+        streamed = MonteCarloSimulator(5000, 2.0, 42, use_numba=True, keep_samples=False).run_simulation()
+
+        self.assertIsNone(streamed.policy_costs)
+        np.testing.assert_array_equal(streamed.total_costs, kept.total_costs)
+
+        for policy_key, kept_stats in kept.statistics['policy_statistics'].items():
+            streamed_stats = streamed.statistics['policy_statistics'][policy_key]
+            self.assertAlmostEqual(streamed_stats['mean'], kept_stats['mean'])
+            self.assertAlmostEqual(streamed_stats['std'], kept_stats['std'])
+            self.assertAlmostEqual(streamed_stats['median'], kept_stats['median'],
+                                   delta=0.01 * kept_stats['std'])
+
+    def test_sensitivity_analysis(self):
+        """Test analytic variance contributions against the sampled variances"""
+        simulator = MonteCarloSimulator(20000, 2.0, 42)
+        results = simulator.run_simulation()
+        sensitivity = run_sensitivity_analysis(simulator, results)
+
+        total_contribution = sum(sens['contribution_to_total'] for sens in sensitivity.values())
+        self.assertAlmostEqual(total_contribution, 1.0)
+
+        for idx, policy_key in enumerate(results.policy_keys):
+            sampled_variance = np.var(results.policy_costs[:, idx])
+            self.assertAlmostEqual(sensitivity[policy_key]['variance'], sampled_variance,
+                                   delta=0.05 * sampled_variance)
+
+    def test_streaming_statistics(self):
+        """Test that streamed per-policy statistics match the in-memory ones"""
+        kept = MonteCarloSimulator(5000, 2.0, 42).run_simulation()
+        streamed = MonteCarloSimulator(5000, 2.0, 42, keep_samples=False).run_simulation()
+
+        self.assertIsNone(streamed.policy_costs)
+        np.testing.assert_allclose(streamed.total_costs, kept.total_costs)
+
+        for policy_key, kept_stats in kept.statistics['policy_statistics'].items():
+            streamed_stats = streamed.statistics['policy_statistics'][policy_key]
+            self.assertAlmostEqual(streamed_stats['mean'], kept_stats['mean'])
+            self.assertAlmostEqual(streamed_stats['std'], kept_stats['std'])
+            self.assertAlmostEqual(streamed_stats['median'], kept_stats['median'],
+                                   delta=0.01 * kept_stats['std'])
+
+
+class TestParallelSampling(unittest.TestCase):
+    """Test process-parallel sampling"""
+
+    def test_parallel_sampling_reproducible(self):
+        """Test that sharded sampling has the right shape and respects the seed"""
+        means = np.array([0.7, 6.0, 10.0, 0.075])
+        stds = np.array([0.1, 1.0, 1.5, 0.025])
+
+        costs, revenues = sample_costs_parallel(means, stds, 10.0, 1.5, 1001, 42, processes=2)
+        costs_again, revenues_again = sample_costs_parallel(means, stds, 10.0, 1.5, 1001, 42, processes=2)
+
+        self.assertEqual(costs.shape, (1001, 4))
+        self.assertEqual(revenues.shape, (1001,))
+        self.assertTrue(np.all(costs >= 0))
+        np.testing.assert_array_equal(costs, costs_again)
+        np.testing.assert_array_equal(revenues, revenues_again)
+
 
 class TestPolicyParameters(unittest.TestCase):
     """Test policy parameter definitions"""
@@ -162,6 +295,28 @@ class TestPolicyParameters(unittest.TestCase):
             # Standard deviation shouldn't be too large relative to mean
             self.assertLess(param.std_dev, param.mean * 2)
 
+    def test_sample_all(self):
+        """Test batched sampling of all policies and revenue"""
+        policy_costs, revenues = sample_all(_RNG, 5000)
+
+        self.assertEqual(policy_costs.shape, (5000, len(POLICY_KEYS)))
+        self.assertEqual(revenues.shape, (5000,))
+        self.assertTrue(np.all(policy_costs >= 0))
+        self.assertTrue(np.all(revenues >= 0))
+
+        for idx, policy_key in enumerate(POLICY_KEYS):
+            param = POLICY_PARAMETERS[policy_key]
+            self.assertAlmostEqual(policy_costs[:, idx].mean(), param.mean, delta=4 * param.std_dev / np.sqrt(5000))
+
+    def test_parameter_arrays_read_only(self):
+        """Test that the shared parameter arrays cannot be modified in place"""
+        _, means, std_devs, _, _ = get_policy_summary_arrays()
+
+        with self.assertRaises(ValueError):
+            means[0] = 0.0
+        with self.assertRaises(ValueError):
+            std_devs *= 2
+
     def test_total_cost_calculation(self):
         """Test total cost calculation"""
         mean_total, std_total = get_total_policy_costs()